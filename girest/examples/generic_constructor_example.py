@@ -19,19 +19,17 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from girest.main import GIRest
 
+# Namespaces shown by the examples
+NAMESPACES = [("GObject", "2.0"), ("Gst", "1.0")]
 
-def show_gvalue_example():
+
+def show_gvalue_example(schema):
     """Show GValue (GObject.Value) example with generic constructor."""
     print("=" * 80)
     print("EXAMPLE: Using Generic Constructor for GObject.Value")
     print("=" * 80)
     print()
 
-    # Generate schema
-    girest = GIRest("GObject", "2.0")
-    spec = girest.generate()
-    schema = spec.to_dict()
-
     # Show the endpoints
     print("1. Generic Constructor Endpoint")
     print("-" * 80)
@@ -118,7 +116,7 @@ async function useGValue() {
     """)
 
 
-def show_gst_meta_example():
+def show_gst_meta_example(schema):
     """Show GstMeta example with generic constructor."""
     print()
     print("=" * 80)
@@ -126,11 +124,6 @@ def show_gst_meta_example():
     print("=" * 80)
     print()
 
-    # Generate schema
-    girest = GIRest("Gst", "1.0")
-    spec = girest.generate()
-    schema = spec.to_dict()
-
     # Show the endpoints
     new_path = "/Gst/Meta/new"
     operation = schema["paths"][new_path]["get"]
@@ -177,7 +170,7 @@ async function compareMetas(buffer1: GstBuffer, buffer2: GstBuffer) {
     """)
 
 
-def show_summary():
+def show_summary(schemas):
     """Show summary of all structs with generic constructors."""
     print()
     print("=" * 80)
@@ -188,11 +181,7 @@ def show_summary():
     # Collect from multiple namespaces
     all_structs = []
 
-    for namespace, version in [("GObject", "2.0"), ("Gst", "1.0")]:
-        girest = GIRest(namespace, version)
-        spec = girest.generate()
-        schema = spec.to_dict()
-
+    for namespace, schema in schemas.items():
         for path, operations in schema["paths"].items():
             for method, operation in operations.items():
                 if operation.get("x-gi-generic") and operation.get("x-gi-constructor"):
@@ -219,6 +208,8 @@ def show_summary():
 
 
 if __name__ == "__main__":
-    show_gvalue_example()
-    show_gst_meta_example()
-    show_summary()
+    # Generate each schema once and share it between the examples
+    schemas = {namespace: GIRest(namespace, version).generate().to_dict() for namespace, version in NAMESPACES}
+    show_gvalue_example(schemas["GObject"])
+    show_gst_meta_example(schemas["Gst"])
+    show_summary(schemas)
@@ -7,6 +7,9 @@ creating proper class hierarchies with methods organized by their tags.
 """
 
 import argparse
+import concurrent.futures
+import hashlib
+import json
 import os
 import sys
 
@@ -19,9 +22,56 @@ import gi  # noqa: E402
 
 gi.require_version("GIRepository", "2.0")
 
+import generator  # noqa: E402
 from generator import TypeScriptGenerator  # noqa: E402
 from main import GIRest  # noqa: E402
 
+# Sidecar file, relative to the output directory, with the hash of the last generation inputs and the files it wrote
+HASH_FILE = os.path.join(".girest-cache", "typescript.hash")
+
+# Generator of a worker process, built once by init_worker() and shared by all its namespaces
+_worker_generator = None
+
+
+def inputs_hash(ts_gen, openapi_schema, args):
+    """Hash everything the generated files depend on: the schema, the API location, the generator and the templates."""
+    h = hashlib.blake2b()
+    h.update(json.dumps(openapi_schema, sort_keys=True).encode())
+    h.update(json.dumps([args.host, args.port, args.base_path]).encode())
+    with open(generator.__file__, "rb") as f:
+        h.update(f.read())
+    template_dir = ts_gen.get_template_dir()
+    for name in sorted(os.listdir(template_dir)):
+        h.update(name.encode())
+        with open(os.path.join(template_dir, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def is_up_to_date(hash_path, current_hash, output_dir):
+    """Check that the last generation used the same inputs and that all the files it wrote still exist."""
+    try:
+        with open(hash_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(cache, dict) or cache.get("hash") != current_hash:
+        return False
+    generated = cache.get("files")
+    return bool(generated) and all(os.path.exists(os.path.join(output_dir, path)) for path in generated)
+
+
+def init_worker(openapi_schema, host, port, base_path):
+    """Build the generator of a worker process, the schema is sent once per worker instead of per namespace."""
+    global _worker_generator
+    _worker_generator = TypeScriptGenerator(openapi_schema, host=host, port=port, base_path=base_path)
+
+
+def generate_namespace(output, namespace):
+    """Generate the files of a single namespace, run in a worker process, along with the schemas that failed."""
+    files = _worker_generator.generate(output, [namespace])
+    return files, _worker_generator.failed_schemas
+
 
 def main():
     """Main entry point for girest-ts tool."""
@@ -32,6 +82,10 @@ def main():
     parser.add_argument("--host", default="localhost", help="Host for REST API calls (default: localhost)")
     parser.add_argument("--port", type=int, default=9000, help="Port for REST API calls (default: 9000)")
     parser.add_argument("--base-path", default="", help="Base path for REST API calls (default: '')")
+    parser.add_argument("--force", action="store_true", help="Generate even if the inputs did not change")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of processes generating namespaces in parallel (default: 1)"
+    )
 
     args = parser.parse_args()
 
@@ -44,8 +98,32 @@ def main():
         # Generate TypeScript bindings using Jinja2-based generator
         ts_gen = TypeScriptGenerator(openapi_schema, host=args.host, port=args.port, base_path=args.base_path)
 
+        # Skip the generation when the previous run used the same inputs
+        hash_path = os.path.join(args.output, HASH_FILE)
+        current_hash = inputs_hash(ts_gen, openapi_schema, args)
+        if not args.force and is_up_to_date(hash_path, current_hash, args.output):
+            print(f"Bindings in {args.output} are up to date", file=sys.stderr)
+            return
+
         # Multi-file generation (always)
-        files = ts_gen.generate(args.output)
+        namespaces = ts_gen.get_namespaces()
+        if args.jobs > 1 and len(namespaces) > 1:
+            # Each worker builds its generator once and renders the namespaces it is given
+            files = {}
+            failed = []
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=args.jobs,
+                initializer=init_worker,
+                initargs=(openapi_schema, args.host, args.port, args.base_path),
+            ) as executor:
+                jobs = [executor.submit(generate_namespace, args.output, ns) for ns in namespaces]
+                for job in jobs:
+                    job_files, job_failed = job.result()
+                    files.update(job_files)
+                    failed.extend(job_failed)
+        else:
+            files = ts_gen.generate(args.output)
+            failed = ts_gen.failed_schemas
 
         # Write all files
         for file_path, content in files.items():
@@ -56,6 +134,14 @@ def main():
                 f.write(content)
             print(f"Generated: {file_path}", file=sys.stderr)
 
+        # Only remember the inputs when everything was generated, so a failed run is retried next time
+        if failed:
+            print(f"Warning: failed to generate {', '.join(sorted(failed))}", file=sys.stderr)
+        else:
+            os.makedirs(os.path.dirname(hash_path), exist_ok=True)
+            with open(hash_path, "w") as f:
+                json.dump({"hash": current_hash, "files": sorted(os.path.relpath(p, args.output) for p in files)}, f)
+
         print(f"\nSuccessfully generated {len(files)} files to {args.output}", file=sys.stderr)
 
     except Exception as e:
@@ -23,6 +23,7 @@ def main():
 
     args = parser.parse_args()
 
+    resolver = None
     try:
         # Create the resolver with Frida
         resolver = FridaResolver(args.namespace, args.version, args.pid)
@@ -37,6 +38,9 @@ def main():
 
         traceback.print_exc(file=sys.stderr)
         sys.exit(1)
+    finally:
+        if resolver is not None:
+            resolver.close()
 
 
 if __name__ == "__main__":
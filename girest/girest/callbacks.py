@@ -31,7 +31,7 @@ class CallbackSecurity:
         """
         self.secret_key = secret_key.encode() if isinstance(secret_key, str) else secret_key
 
-    def create_headers(self, payload: Dict[str, Any]) -> Dict[str, str]:
+    def create_headers(self, payload: Dict[str, Any], body: Optional[str] = None) -> Dict[str, str]:
         """
         Create signed headers for a callback HTTP request.
 
@@ -40,6 +40,7 @@ class CallbackSecurity:
 
         Args:
             payload: Dictionary containing the callback data
+            body: Canonical JSON of the payload, if already serialized
 
         Returns:
             Dictionary of HTTP headers including signature and timestamp
@@ -50,7 +51,9 @@ class CallbackSecurity:
             >>> print(headers['X-Callback-Signature'])
         """
         timestamp = datetime.now(timezone.utc).isoformat()
-        signature = self.sign_payload(payload, timestamp)
+        if body is None:
+            body = self.canonical_json(payload)
+        signature = self.sign_body(body, timestamp)
 
         return {
             "X-Callback-Signature": signature,
@@ -73,17 +76,32 @@ class CallbackSecurity:
         Returns:
             Hexadecimal signature string
         """
-        # Create canonical JSON representation (sorted keys, no whitespace)
-        canonical_json = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return self.sign_body(self.canonical_json(payload), timestamp)
 
+    def sign_body(self, body: str, timestamp: str) -> str:
+        """
+        Generate HMAC signature for an already serialized callback payload.
+
+        Args:
+            body: Canonical JSON representation of the payload
+            timestamp: ISO format timestamp string
+
+        Returns:
+            Hexadecimal signature string
+        """
         # Create message: timestamp.payload
-        message = f"{timestamp}.{canonical_json}"
+        message = f"{timestamp}.{body}"
 
         # Generate HMAC-SHA256 signature
         signature = hmac.new(self.secret_key, message.encode("utf-8"), hashlib.sha256).hexdigest()
 
         return signature
 
+    @staticmethod
+    def canonical_json(payload: Dict[str, Any]) -> str:
+        """Serialize a payload the way it is signed: sorted keys and no whitespace."""
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
     def verify_signature(self, payload: Dict[str, Any], timestamp: str, provided_signature: str) -> bool:
         """
         Verify that a signature is valid for the given payload and timestamp.
@@ -193,7 +211,9 @@ class CallbackHandler:
         if not self.callback_url or not self.security:
             return None
 
-        headers = self.security.create_headers(payload)
+        # Serialize once, the same bytes are signed and sent
+        body = CallbackSecurity.canonical_json(payload)
+        headers = self.security.create_headers(payload, body)
 
         start_time = time.time()
 
@@ -202,7 +222,9 @@ class CallbackHandler:
 
             logger.debug(f"Posting callback to {self.callback_url} with payload: {payload}")
 
-            response = requests.post(self.callback_url, json=payload, headers=headers, timeout=self.timeout)
+            response = requests.post(
+                self.callback_url, data=body.encode("utf-8"), headers=headers, timeout=self.timeout
+            )
 
             elapsed_ms = (time.time() - start_time) * 1000
             self.stats["total_time_ms"] += elapsed_ms
@@ -1,8 +1,10 @@
 import logging
 import os
-from typing import Any, Dict, List, Optional, Set
+import sys
+from functools import cached_property
+from typing import Any, Callable, Dict, Final, FrozenSet, Iterable, List, Optional, Set, Tuple
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from jinja2.exceptions import TemplateNotFound
 
 try:
@@ -13,11 +15,43 @@ except ImportError:
 
 logger = logging.getLogger("girest")
 
+# HTTP verbs that map to generated methods, other path item keys are ignored
+_HTTP_VERBS: Final = frozenset(["get", "post", "put", "delete", "patch"])
+
+TagIndex = Dict[str, List[Tuple[str, str, Dict[str, Any]]]]
+
+
+def _index_operations(paths: Dict[str, Any]) -> TagIndex:
+    """
+    Index the OpenAPI path operations by primary tag.
+
+    Args:
+        paths: The paths section of the OpenAPI schema
+
+    Returns:
+        The (path, verb, operation) entries of the first operation of each path, by primary tag
+    """
+    tag_index: TagIndex = {}
+    for path, path_operations in paths.items():
+        seen_tags: Set[str] = set()
+        for verb, operation in path_operations.items():
+            if verb.lower() not in _HTTP_VERBS:
+                continue
+            tags = operation.get("tags")
+            if not tags or tags[0] in seen_tags:
+                continue
+            seen_tags.add(tags[0])
+            tag_index.setdefault(tags[0], []).append((path, verb, operation))
+
+    return tag_index
+
 
 class Info:
     """Base class for all OpenAPI schema objects with dependency management."""
 
     info_type = None
+    # Only schemas render imports, so only they keep a set, the rest just propagate to their parent
+    dependencies: Optional[Set[str]] = None
 
     def __init__(self, generator: "Generator", schema_section: Dict[str, Any], parent: Optional["Info"] = None):
         """
@@ -31,7 +65,6 @@ class Info:
         self.generator = generator
         self.schema_section = schema_section
         self.parent = parent
-        self.dependencies: Set[str] = set()
 
     def add_dependency(self, dependency: str):
         """
@@ -40,7 +73,8 @@ class Info:
         Args:
             dependency: The name of the dependency to add
         """
-        self.dependencies.add(dependency)
+        if self.dependencies is not None:
+            self.dependencies.add(dependency)
         if self.parent:
             self.parent.add_dependency(dependency)
 
@@ -54,7 +88,7 @@ class Info:
         """Get the name of the Info object"""
         raise NotImplementedError("Subclasses must implement name() method")
 
-    @property
+    @cached_property
     def valid_name(self) -> str:
         return self.generator.get_valid_name(self)
 
@@ -84,6 +118,10 @@ class Generator:
         self.components = openapi_schema.get("components", {})
         self.schemas = self.components.get("schemas", {})
         self.paths = openapi_schema.get("paths", {})
+
+        # Index the paths once, every schema looks its methods up here. The index is not shared
+        # between generators: it is a single pass over the paths, negligible next to the rendering.
+        self._tag_index = _index_operations(self.paths)
         self.host = host
         self.port = port
         self.base_path = base_path
@@ -91,10 +129,21 @@ class Generator:
 
         # Cache for Schema objects to avoid recreating them
         self.schema_objects_cache: Dict[str, "Schema"] = {}
+        self._schemas_built = False
+        # Names of the schemas that failed to generate in the last generate() call
+        self.failed_schemas: List[str] = []
+        # Canonical Method signature tuples
+        self.signatures: Dict[Tuple[str, Tuple[str, ...]], Tuple[str, Tuple[str, ...]]] = {}
 
         # Setup Jinja2 environment using template directory from subclass
         template_dir = self.get_template_dir()
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir), trim_blocks=True, lstrip_blocks=True)
+        # Keep the compiled templates in Jinja's per-user temporary cache directory between runs
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=FileSystemBytecodeCache(),
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
 
     def add_schema(self, schema: "Schema"):
         self.schema_objects_cache[schema.name] = schema
@@ -146,24 +195,10 @@ class Generator:
             List of Method objects created from matching operations
         """
         methods = []
-
-        for path, path_operations in self.paths.items():
-            # Check if any operation in this path has our schema name as tag
-            path_matches = False
-            for method, operation in path_operations.items():
-                if method.lower() not in ["get", "post", "put", "delete", "patch"]:
-                    continue
-
-                tags = operation.get("tags", [])
-                if tags:
-                    if tags[0] == schema.name:
-                        path_matches = True
-                        break
-
-            if path_matches:
-                # Create Method object with operation dict, path, and http_method directly
-                method_obj = Method(operation, path, method, schema, self)
-                methods.append(method_obj)
+        for path, method, operation in self._tag_index.get(schema.name, []):
+            # Create Method object with operation dict, path, and http_method directly
+            method_obj = Method(operation, path, method, schema, self)
+            methods.append(method_obj)
 
         return methods
 
@@ -174,15 +209,7 @@ class Generator:
         component schemas, and creates Namespace schema objects to hold those operations.
         """
         # Find all unique tags from operations
-        operation_tags = set()
-        for path, path_operations in self.paths.items():
-            for method, operation in path_operations.items():
-                if method.lower() not in ["get", "post", "put", "delete", "patch"]:
-                    continue
-
-                tags = operation.get("tags", [])
-                if tags:
-                    operation_tags.add(tags[0])  # Use first tag as primary
+        operation_tags = set(self._tag_index)
 
         # Find tags that don't correspond to component schemas
         for tag in operation_tags:
@@ -191,34 +218,75 @@ class Generator:
                 schema = Namespace(tag, self)
                 self.add_schema(schema)
 
-    def generate(self, output_dir: str) -> Dict[str, str]:
+    def _resolve_valid_names(self):
+        """Resolve the valid name of every method, visiting each schema after its ancestors.
+
+        Name conflicts are checked against the inherited methods, so resolving the ancestors
+        first means every conflict check finds the parent names already cached.
+        """
+        resolved: Set["Schema"] = set()
+        for schema in list(self.schema_objects_cache.values()):
+            # Collect the not yet resolved part of the inheritance chain
+            lineage = []
+            current = schema
+            while current is not None and current not in resolved:
+                resolved.add(current)
+                lineage.append(current)
+                current = getattr(current, "parent_schema", None)
+
+            for s in reversed(lineage):
+                for method in getattr(s, "_methods", []):
+                    # Reading the cached property stores the name on the method
+                    _ = method.valid_name
+
+    def _build_schemas(self):
+        """Create the Schema objects of every component and namespace, once per generator."""
+        if self._schemas_built:
+            return
+        # First create all schemas
+        for schema_name, schema_def in self.schemas.items():
+            schema = Schema.create_schema(schema_name, schema_def, self, None)
+            if schema:
+                self.add_schema(schema)
+        # Create namespace schemas for tags without component schemas
+        self._create_namespace_schemas()
+        # Resolve the method names in a single pass, ancestors first
+        self._resolve_valid_names()
+        self._schemas_built = True
+
+    def _group_by_namespace(self) -> Dict[str, List["Schema"]]:
+        """Group the built schemas by the namespace their files are generated in."""
+        schemas_by_namespace: Dict[str, List["Schema"]] = {}
+        for schema in self.schema_objects_cache.values():
+            namespace = getattr(schema, "namespace", None)
+            if namespace:
+                schemas_by_namespace.setdefault(namespace, []).append(schema)
+        return schemas_by_namespace
+
+    def get_namespaces(self) -> List[str]:
+        """Get the namespaces the generated files are grouped in."""
+        self._build_schemas()
+        return sorted(self._group_by_namespace())
+
+    def generate(self, output_dir: str, namespaces: Optional[Iterable[str]] = None) -> Dict[str, str]:
         """
         Generate TypeScript bindings as multiple files (one per class/interface).
 
         Args:
             output_dir: Base directory for generated files
+            namespaces: Only generate the schema and index files of these namespaces, all of them if None.
+                The shared and main entry point files are always generated.
 
         Returns:
             Dictionary mapping file paths to their content
         """
+        selected = set(namespaces) if namespaces is not None else None
         files = {}
+        self.failed_schemas = []
 
-        # First create all schemas
-        for schema_name, schema_def in self.schemas.items():
-            schema = Schema.create_schema(schema_name, schema_def, self, None)
-            if schema:
-                self.add_schema(schema)
-        # Create namespace schemas for tags without component schemas
-        self._create_namespace_schemas()
-
+        self._build_schemas()
         # Group schemas by namespace
-        schemas_by_namespace = {}
-        for schema_name, schema in self.schema_objects_cache.items():
-            namespace = getattr(schema, "namespace", None)
-            if namespace:
-                if namespace not in schemas_by_namespace:
-                    schemas_by_namespace[namespace] = []
-                schemas_by_namespace[namespace].append(schema)
+        schemas_by_namespace = self._group_by_namespace()
 
         # Generate files for each schema
         for schema_name, schema in self.schema_objects_cache.items():
@@ -227,6 +295,8 @@ class Generator:
             if not namespace:
                 # Skip schemas without namespace (like Pointer, Event)
                 continue
+            if selected is not None and namespace not in selected:
+                continue
 
             # Determine file path: output_dir/{Namespace}/{ClassName}.ts
             file_path = os.path.join(output_dir, namespace, f"{schema.name}.ts")
@@ -237,6 +307,7 @@ class Generator:
                 files[file_path] = content
             except Exception as e:
                 logger.error(f"Error generating {schema.name}: {e}")
+                self.failed_schemas.append(schema.name)
                 import traceback
 
                 traceback.print_exc()
@@ -244,6 +315,8 @@ class Generator:
         # Generate index.ts for each namespace
         namespace_index_template = self.jinja_env.get_template("namespace_index.ts.j2")
         for namespace, schemas in schemas_by_namespace.items():
+            if selected is not None and namespace not in selected:
+                continue
             index_path = os.path.join(output_dir, namespace, "index.ts")
 
             # Sort schemas and render template
@@ -320,9 +393,10 @@ class Type(Info):
         else:
             return self.schema_section.get("type", "any")
 
-    @property
+    @cached_property
     def lang_type(self):
-        return self.generator.lang_type(self)
+        # The language type only depends on the schema and the referenced schema name
+        return sys.intern(self.generator.lang_type(self))
 
     @property
     def ref_schema(self) -> "Schema":
@@ -331,7 +405,7 @@ class Type(Info):
             self._ref_schema = self.generator.get_schema(self._component_name)
         return self._ref_schema
 
-    @property
+    @cached_property
     def subtype(self) -> "Type":
         et = self.schema_section.get("x-gi-element-type", None)
         if et:
@@ -474,7 +548,8 @@ class Schema(Info):
 
     def __init__(self, name: str, schema_def: Dict[str, Any], generator: "Generator", parent: Optional["Info"] = None):
         super().__init__(generator, schema_def, parent)
-        self._name = name
+        self.dependencies = set()
+        self._name = sys.intern(name)
         self.parse_schema()
 
     @property
@@ -538,6 +613,10 @@ class Schema(Info):
             - is_type_only: Whether this is a type-only import
             - same_namespace: Whether it's in the same namespace as this schema
         """
+        # Methods build their parameters lazily, resolve them so their types are registered
+        for method in getattr(self, "_methods", []):
+            method.resolve_dependencies()
+
         deps = []
         deps_set = set()  # Track what we've already added
 
@@ -1039,17 +1118,28 @@ class Method(Info):
         self.operation_dict = operation_dict
         self.path = path
         self.http_method = http_method
-        self.return_obj = Return(operation_dict, generator, self)
+        self._dependencies_resolved = False
+
+        # Resolve the method flags once, templates check them many times
+        self.is_constructor: bool = operation_dict.get("x-gi-constructor", False)
+        self.is_destructor: bool = operation_dict.get("x-gi-destructor", False)
+        self.is_copy: bool = operation_dict.get("x-gi-copy", False)
+        has_path_params = any(p.get("in", "query") == "path" for p in operation_dict.get("parameters", []))
+        self.is_static: bool = self.is_constructor or not has_path_params
 
+    @cached_property
+    def return_obj(self) -> "Return":
+        return Return(self.operation_dict, self.generator, self)
+
+    @cached_property
+    def parameters(self) -> List[Param]:
         # Parse parameters using the Param class
-        self.parameters: List[Param] = []
-        raw_parameters = self.operation_dict.get("parameters", [])
-        for param_def in raw_parameters:
-            param = Param(param_def, self.generator, self)
-            self.parameters.append(param)
+        return [Param(param_def, self.generator, self) for param_def in self.operation_dict.get("parameters", [])]
 
+    @cached_property
+    def body_properties(self) -> List[Param]:
         # Parse request body properties for POST/PUT methods
-        self.body_properties: List[Param] = []
+        body_properties = []
         request_body = self.operation_dict.get("requestBody", {})
         if request_body:
             content = request_body.get("content", {})
@@ -1073,7 +1163,17 @@ class Method(Info):
                         param_def[key] = prop_schema[key]
 
                 param = Param(param_def, self.generator, self)
-                self.body_properties.append(param)
+                body_properties.append(param)
+        return body_properties
+
+    def resolve_dependencies(self):
+        """
+        Build the lazily created parameters and return values so their dependencies
+        reach the parent schema before its imports are rendered.
+        """
+        if self._dependencies_resolved:
+            return
+        self._dependencies_resolved = True
 
         # Add callback dependencies to parent schema
         for param in self.parameters + self.body_properties:
@@ -1115,46 +1215,18 @@ class Method(Info):
             raise ValueError(f"Path {self.path} does not follow the operationId pattern")
         return parsed
 
-    @property
+    @cached_property
     def id(self) -> str:
         """Extract method name from operation ID"""
         namespace_name, class_name, method_name, operation = self.parsed_operation_id
-        name = namespace_name
-        if class_name:
-            name += class_name
-        if operation:
-            name += f"_{operation}"
-        name += f"_{method_name}"
-        return name
+        return f"{namespace_name}{class_name or ''}{'_' + operation if operation else ''}_{method_name}"
 
-    @property
+    @cached_property
     def name(self) -> str:
         # The name of the function is {method_name} or {operation}_{method_name}
         _, _, method_name, operation = self.parsed_operation_id
-        if operation:
-            return f"{operation}_{method_name}"
-        else:
-            return method_name
-
-    @property
-    def is_constructor(self) -> bool:
-        return self.schema_section.get("x-gi-constructor", False)
-
-    @property
-    def is_destructor(self) -> bool:
-        return self.schema_section.get("x-gi-destructor", False)
-
-    @property
-    def is_copy(self) -> bool:
-        return self.schema_section.get("x-gi-copy", False)
-
-    @property
-    def is_static(self) -> bool:
-        if self.is_constructor:
-            return True
-        if not self.path_params:
-            return True
-        return False
+        # Interned so name and signature comparisons between methods match on identity
+        return sys.intern(f"{operation}_{method_name}" if operation else method_name)
 
     @property
     def is_namespace_function(self) -> bool:
@@ -1195,22 +1267,15 @@ class Method(Info):
                 template = self.generator.jinja_env.get_template(f"{self.info_type}.ts.j2")
         return template.render(**{self.info_type: self})
 
-    def is_equal(self, other: "Method") -> bool:
-        # Check the name
-        if self.name != other.name:
-            return False
-        # Check the number of params
-        if len(self.params) != len(other.params):
-            return False
-
-        # Check the type of params
-        for i in range(len(self.params)):
-            p = self.params[i]
-            po = other.params[i]
-            if p.type.lang_type != po.type.lang_type:
-                return False
+    @cached_property
+    def signature(self) -> Tuple[str, Tuple[str, ...]]:
+        """The name and the language types of the parameters, used to compare overloads."""
+        signature = (self.name, tuple(p.type.lang_type for p in self.params))
+        # Share one tuple per distinct signature, equal signatures are then the same object
+        return self.generator.signatures.setdefault(signature, signature)
 
-        return True
+    def is_equal(self, other: "Method") -> bool:
+        return self.signature is other.signature
 
 
 """
@@ -1224,11 +1289,9 @@ x-gi-type (object, struct, enum, callback, etc.) is handled by dedicated methods
 """
 
 
-class TypeScriptGenerator(Generator):
-    """Generates TypeScript bindings from OpenAPI schema using Jinja2 templates."""
-
-    # Reserved keywords in TypeScript/JavaScript
-    RESERVED_KEYWORDS = {
+# Reserved keywords in TypeScript/JavaScript
+_RESERVED_KEYWORDS: Final = frozenset(
+    {
         "function",
         "var",
         "let",
@@ -1284,10 +1347,42 @@ class TypeScriptGenerator(Generator):
         "value",
         "url",
     }
+)
+# Names longer than every keyword, or starting with a letter no keyword starts with, can skip the set lookup
+_MAX_KEYWORD_LENGTH: Final = max(len(keyword) for keyword in _RESERVED_KEYWORDS)
+_KEYWORD_INITIALS: Final = frozenset(keyword[0] for keyword in _RESERVED_KEYWORDS)
+
+# OpenAPI basic types to TypeScript types
+_TYPE_MAPPING: Final = {
+    "string": "string",
+    "integer": "number",
+    "number": "number",
+    "boolean": "boolean",
+    "object": "object",
+}
+
+
+def _is_reserved_keyword(name: str) -> bool:
+    if not name or len(name) > _MAX_KEYWORD_LENGTH or name[0] not in _KEYWORD_INITIALS:
+        return False
+    return name in _RESERVED_KEYWORDS
+
+
+class TypeScriptGenerator(Generator):
+    """Generates TypeScript bindings from OpenAPI schema using Jinja2 templates."""
+
+    # Reserved keywords in TypeScript/JavaScript
+    RESERVED_KEYWORDS = _RESERVED_KEYWORDS
 
     def __init__(self, openapi_schema: Dict[str, Any], host: str = "localhost", port: int = 9000, base_path: str = ""):
         super().__init__(openapi_schema, host, port, base_path)
         # Base class already sets up jinja_env - no need to override unless specific customization needed
+        # Methods of the inheritance chain, keyed by the schema object it starts from
+        self._parent_methods_cache: Dict[Optional["Schema"], FrozenSet["Method"]] = {}
+        self._parent_methods_by_name_cache: Dict[Optional["Schema"], Dict[str, List["Method"]]] = {}
+        # Naming rules by Info class, subclasses are added the first time they are seen
+        self._name_handler_bases = ((Enum, self._name_for_enum), (Method, self._name_for_method))
+        self._name_handlers: Dict[type, Callable[["Info"], str]] = dict(self._name_handler_bases)
 
     def get_template_dir(self) -> str:
         """Get the template directory for TypeScript generation."""
@@ -1303,67 +1398,75 @@ class TypeScriptGenerator(Generator):
         Returns:
             A safe name for TypeScript
         """
-        # The name of an Enum might vary, or either Enum or EnumValue
-        if isinstance(info, Enum):
-            if info.methods:
-                return f"{info.name}Value"
-            else:
-                return f"{info.name}"
-        elif isinstance(info, Method):
-            # For methods, handle inheritance conflicts
-            method = info
-            schema = method.parent
-
-            # Get all method names from parent classes
-            if isinstance(schema, Object):
-                parent_methods = self._get_parent_methods(schema.parent_schema)
-
-                # Check for conflicts and add suffix if needed
-                for m in parent_methods:
-                    if info.name == m.name and not info.is_equal(m):
-                        # increment the suffix for the valid name
-                        logger.info(f"Renaming {info.name} for {info.parent.name}")
-                        suffix = 2
-                        while f"{info.name}_{suffix}" == m.valid_name:
-                            suffix += 1
-                        return f"{info.name}_{suffix}"
-                return info.name
-
-            # Check for reserved keywords - but skip for constructor methods
-            # Constructor methods should keep their original names (like "new")
-            if not method.is_constructor and info.name in self.RESERVED_KEYWORDS:
-                return f"{info.name}_"
-
-            # Check for names starting with digits (invalid JS identifiers)
-            # Example: GstVideo.VideoScaler has a method named "2d"
-            if info.name and info.name[0].isdigit():
-                return f"_{info.name}"
+        handler = self._name_handlers.get(type(info))
+        if handler is None:
+            # Subclasses (like Flags) resolve through isinstance once, then hit the table
+            handler = next(
+                (h for cls, h in self._name_handler_bases if isinstance(info, cls)),
+                self._name_for_default,
+            )
+            self._name_handlers[type(info)] = handler
+        return handler(info)
 
-            return info.name
+    def _name_for_enum(self, info: "Enum") -> str:
+        # The name of an Enum might vary, or either Enum or EnumValue
+        if info.methods:
+            return f"{info.name}Value"
         else:
-            # Handle reserved keywords for non-method objects
-            if info.name in self.RESERVED_KEYWORDS:
-                return f"{info.name}_"
+            return f"{info.name}"
+
+    def _name_for_method(self, info: "Method") -> str:
+        # For methods, handle inheritance conflicts
+        method = info
+        schema = method.parent
+
+        # Get all method names from parent classes
+        if isinstance(schema, Object):
+            candidates = self._get_parent_methods_by_name(schema.parent_schema).get(info.name, ())
+
+            # Check for conflicts and add a suffix past the highest one already in use
+            suffix = max(
+                (self._name_suffix(info.name, m.valid_name) for m in candidates if info.signature is not m.signature),
+                default=0,
+            )
+            if suffix:
+                logger.info(f"Renaming {info.name} for {info.parent.name}")
+                return f"{info.name}_{suffix + 1}"
             return info.name
 
+        # Check for reserved keywords - but skip for constructor methods
+        # Constructor methods should keep their original names (like "new")
+        if not method.is_constructor and _is_reserved_keyword(info.name):
+            return f"{info.name}_"
+
+        # Check for names starting with digits (invalid JS identifiers)
+        # Example: GstVideo.VideoScaler has a method named "2d"
+        if info.name and info.name[0].isdigit():
+            return f"_{info.name}"
+
+        return info.name
+
+    def _name_for_default(self, info: "Info") -> str:
+        # Handle reserved keywords for non-method objects
+        if _is_reserved_keyword(info.name):
+            return f"{info.name}_"
+        return info.name
+
     def lang_type(self, t: "Type") -> str:
         """Convert OpenAPI basic types to TypeScript types."""
         if t.is_ref:
             return t.ref_schema.valid_name
         if t.type == "array":
-            return "Array<" + self.lang_type(t.subtype) + ">"
-
-        type_mapping = {
-            "string": "string",
-            "integer": "number",
-            "number": "number",
-            "boolean": "boolean",
-            "object": "object",
-        }
-        return type_mapping.get(t.type, "any")
-
-    def _get_parent_methods(self, obj: "Schema") -> Set["Method"]:
+            # Go through the subtype so its cached language type is reused
+            return "Array<" + t.subtype.lang_type + ">"
+        return _TYPE_MAPPING.get(t.type, "any")
+
+    def _get_parent_methods(self, obj: "Schema") -> FrozenSet["Method"]:
         """Get all method names from parent classes in the inheritance chain."""
+        cached = self._parent_methods_cache.get(obj)
+        if cached is not None:
+            return cached
+
         parent_methods = set()
 
         # Check if parent is a Struct (base class case) or Object
@@ -1378,10 +1481,30 @@ class TypeScriptGenerator(Generator):
             # Recursively get names from parent's parents
             parent_methods.update(self._get_parent_methods(obj.parent_schema))
 
-        return parent_methods
+        cached = frozenset(parent_methods)
+        self._parent_methods_cache[obj] = cached
+        return cached
+
+    def _get_parent_methods_by_name(self, obj: "Schema") -> Dict[str, List["Method"]]:
+        """Get the methods of the inheritance chain indexed by their name."""
+        by_name = self._parent_methods_by_name_cache.get(obj)
+        if by_name is None:
+            by_name = {}
+            for method in self._get_parent_methods(obj):
+                by_name.setdefault(method.name, []).append(method)
+            self._parent_methods_by_name_cache[obj] = by_name
+        return by_name
+
+    @staticmethod
+    def _name_suffix(name: str, valid_name: str) -> int:
+        """Get the numeric suffix of a renamed method, 1 when it kept its name."""
+        suffix = valid_name[len(name) + 1 :]
+        if valid_name.startswith(f"{name}_") and suffix.isdigit():
+            return int(suffix)
+        return 1
 
     def _safe_property_name(self, name: str) -> str:
         """Convert a schema property name to a safe TypeScript identifier."""
-        if name in self.RESERVED_KEYWORDS:
+        if _is_reserved_keyword(name):
             return f"{name}_"
         return name
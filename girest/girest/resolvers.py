@@ -3,6 +3,7 @@
 # based on the actual operation information
 
 import asyncio
+import concurrent.futures
 import json
 import logging
 import queue
@@ -27,6 +28,36 @@ from .callbacks import CallbackHandler  # noqa: E402
 
 logger = logging.getLogger("girest")
 
+# How an argument received from REST is converted before passing it to Frida
+_ARG_VALUE = 0
+_ARG_ENUM = 1
+_ARG_POINTER = 2
+_ARG_CALLBACK = 3
+
+# How a value of the response from Frida is converted before returning it to REST
+_RESPONSE_POINTER = 0
+_RESPONSE_POINTER_ARRAY = 1
+_RESPONSE_ENUM = 2
+
+# Map GIRepository type tags to JSON type strings
+_TYPE_TAG_TO_JSON = {
+    GIRepository.TypeTag.BOOLEAN: "bool",
+    GIRepository.TypeTag.INT8: "int8",
+    GIRepository.TypeTag.UINT8: "uint8",
+    GIRepository.TypeTag.INT16: "int16",
+    GIRepository.TypeTag.UINT16: "uint16",
+    GIRepository.TypeTag.INT32: "int32",
+    GIRepository.TypeTag.UINT32: "uint32",
+    GIRepository.TypeTag.INT64: "int64",
+    GIRepository.TypeTag.UINT64: "uint64",
+    GIRepository.TypeTag.UTF8: "string",
+    GIRepository.TypeTag.FILENAME: "string",  # Filename strings (filesystem encoding)
+    GIRepository.TypeTag.FLOAT: "float",
+    GIRepository.TypeTag.DOUBLE: "double",
+    GIRepository.TypeTag.GTYPE: "int64",  # FIXME beware of this
+    GIRepository.TypeTag.VOID: "void",
+}
+
 
 # ============================================================================
 # Helper Classes for Frida Communication
@@ -140,7 +171,7 @@ class FridaMessageBus:
             script: Frida script instance
         """
         self.script = script
-        self._queued_responses: Dict[str, queue.Queue] = {}
+        self._queued_responses: Dict[str, queue.SimpleQueue] = {}
         self._response_lock = threading.Lock()
 
     def execute(self, command: dict, headers: dict, is_async: bool = False, timeout: float = 30.0) -> Any:
@@ -183,7 +214,7 @@ class FridaMessageBus:
         Returns:
             Result from Frida
         """
-        command_json = json.dumps(command)
+        command_json = json.dumps(command, separators=(",", ":"))
         return self.script.exports_sync.run(command_json)
 
     def _execute_queued(self, command: dict, correlation_id: str, is_async: bool = False, timeout: float = 30.0) -> Any:
@@ -208,7 +239,7 @@ class FridaMessageBus:
             Exception: If Frida reports an error
         """
         # Serialize command to JSON string
-        command_json = json.dumps(command)
+        command_json = json.dumps(command, separators=(",", ":"))
 
         # Send queued-call message to Frida using callback-specific type
         # The Frida callback's recv() loop will receive this on the correct thread
@@ -228,7 +259,7 @@ class FridaMessageBus:
             return None
 
         # For synchronous calls, create response queue and wait
-        response_queue = queue.Queue(maxsize=1)
+        response_queue = queue.SimpleQueue()
 
         with self._response_lock:
             self._queued_responses[correlation_id] = response_queue
@@ -347,7 +378,17 @@ class FridaResolver(GIResolver):
         self.scripts = []
         # Build enum value mappings for converting string names to integers
         self.enum_mappings = {}
+        # And the reverse, from integer values to names
+        self.enum_mappings_reverse = {}
         self._build_enum_mappings()
+        # Functions/methods by (namespace, class_name, method_name) and types by (namespace, name)
+        self._method_index = {}
+        self._type_index = {}
+        self._indexed_namespaces = set()
+        # Struct fields by (namespace, struct_name), then by field name
+        self._field_index = {}
+        # Handlers by operation id
+        self._handlers = {}
         # Callback ID counter for URL-based callbacks
         self._callback_id_counter = 0
         # Callback metadata registry: callback_id -> {url, session_id, secret, scope}
@@ -362,6 +403,8 @@ class FridaResolver(GIResolver):
 
         # Initialize message bus with the Frida script
         self.message_bus = FridaMessageBus(self.scripts[0])
+        # Blocking Frida calls run on their own threads, not on the default executor
+        self._executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="frida")
 
         super().__init__()
 
@@ -384,11 +427,17 @@ class FridaResolver(GIResolver):
                 if info_type == GIRepository.InfoType.ENUM or info_type == GIRepository.InfoType.FLAGS:
                     full_name = f"{info.get_namespace()}{info.get_name()}"
                     mapping = {}
+                    reverse_mapping = {}
                     n_values = GIRepository.enum_info_get_n_values(info)
                     for j in range(n_values):
                         value_info = GIRepository.enum_info_get_value(info, j)
-                        mapping[value_info.get_name()] = GIRepository.value_info_get_value(value_info)
+                        value_name = value_info.get_name()
+                        value = GIRepository.value_info_get_value(value_info)
+                        mapping[value_name] = value
+                        # Aliased values resolve to the first name
+                        reverse_mapping.setdefault(value, value_name)
                     self.enum_mappings[full_name] = mapping
+                    self.enum_mappings_reverse[full_name] = reverse_mapping
 
     def _load_script(self, script_path, on_log, on_message):
         s = None
@@ -420,6 +469,12 @@ class FridaResolver(GIResolver):
         for s in scripts:
             self._load_script(s, on_log, on_message)
 
+    def close(self):
+        """Stop the Frida calls executor and detach from the target process"""
+        # Detaching makes any call still blocked in Frida fail, so its thread can finish
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.detach()
+
     def _on_log(self, level, message):
         """Handle the console from js"""
         levels = {
@@ -609,11 +664,8 @@ class FridaResolver(GIResolver):
 
             if info_type == GIRepository.InfoType.ENUM or info_type == GIRepository.InfoType.FLAGS:
                 full_name = f"{interface.get_namespace()}{interface.get_name()}"
-                enum_mapping = self.enum_mappings.get(full_name, {})
                 # Reverse lookup: find string name for integer value
-                for enum_name, enum_value in enum_mapping.items():
-                    if enum_value == value:
-                        return enum_name
+                return self.enum_mappings_reverse.get(full_name, {}).get(value, value)
             # Handle objects/structs - convert to {ptr: "0x..."}
             elif info_type in [GIRepository.InfoType.OBJECT, GIRepository.InfoType.STRUCT]:
                 return {"ptr": value}
@@ -632,13 +684,43 @@ class FridaResolver(GIResolver):
         # No conversion needed
         return value
 
-    def _arg_from_rest(self, rest_value, arg_info, headers):
+    def _prepare_arg_from_rest(self, arg_info):
+        """
+        Precompute how an argument received from REST has to be converted for Frida.
+        The GI introspection is done once per operation instead of on every request.
+
+        Args:
+            arg_info: GIArgInfo of the argument
+
+        Returns:
+            Tuple of (name, arg_info, kind, data) to be used with _arg_from_rest
+        """
+        arg_type = GIRepository.arg_info_get_type(arg_info)
+        tag = GIRepository.type_tag_to_string(GIRepository.type_info_get_tag(arg_type))
+        kind = _ARG_VALUE
+        data = None
+        if tag == "interface":
+            interface = GIRepository.type_info_get_interface(arg_type)
+            info_type = interface.get_type()
+
+            if info_type == GIRepository.InfoType.ENUM or info_type == GIRepository.InfoType.FLAGS:
+                full_name = f"{interface.get_namespace()}{interface.get_name()}"
+                kind = _ARG_ENUM
+                data = self.enum_mappings.get(full_name, {})
+            elif info_type in [GIRepository.InfoType.OBJECT, GIRepository.InfoType.STRUCT]:
+                kind = _ARG_POINTER
+            elif info_type == GIRepository.InfoType.CALLBACK:
+                kind = _ARG_CALLBACK
+                data = interface
+        return (arg_info.get_name(), arg_info, kind, data)
+
+    def _arg_from_rest(self, rest_value, prepared_arg, headers):
         """
         Convert an arg definition as received from REST to how Frida expects it
 
         Args:
             rest_value: The raw json value from REST
-            arg_info: GIArgInfo that corresponds to the arguments being passed
+            prepared_arg: The argument as returned by _prepare_arg_from_rest
             headers: The headers from the request
 
         Returns:
@@ -648,27 +730,17 @@ class FridaResolver(GIResolver):
         if rest_value is None:
             return None
 
-        arg_type = GIRepository.arg_info_get_type(arg_info)
-        tag = GIRepository.type_tag_to_string(GIRepository.type_info_get_tag(arg_type))
-        # Check if this is an interface type
-        if tag != "interface":
-            return rest_value
-
-        interface = GIRepository.type_info_get_interface(arg_type)
-        info_type = interface.get_type()
-
-        if info_type == GIRepository.InfoType.ENUM or info_type == GIRepository.InfoType.FLAGS:
+        _, arg_info, kind, data = prepared_arg
+        if kind == _ARG_ENUM:
             # Convert string enum name to integer value
-            full_name = f"{interface.get_namespace()}{interface.get_name()}"
-            enum_mapping = self.enum_mappings.get(full_name, {})
-            return enum_mapping[rest_value]
-        elif info_type in [GIRepository.InfoType.OBJECT, GIRepository.InfoType.STRUCT]:
+            return data[rest_value]
+        elif kind == _ARG_POINTER:
             # For GObject types, extract the 'ptr' field from the JSON object
             # Our URI parser deserializes "ptr,value" into {"ptr": "value"}
             # but Frida expects just the pointer value
             return rest_value["ptr"]
-        elif info_type == GIRepository.InfoType.CALLBACK:
-            return self._generate_callback(rest_value, arg_info, interface, headers)
+        elif kind == _ARG_CALLBACK:
+            return self._generate_callback(rest_value, arg_info, data, headers)
         return rest_value
 
     def _convert_callback_args(self, args, cb_type):
@@ -711,11 +783,10 @@ class FridaResolver(GIResolver):
     def _type_to_json(self, t):
         """Convert GIRepository type to JSON type dict with name and subtype"""
         # Get the type tag
-        tag_enum = GIRepository.type_info_get_tag(t)
-        tag = GIRepository.type_tag_to_string(tag_enum)
+        tag = GIRepository.type_info_get_tag(t)
 
         # Check if it's an array type
-        if tag == "array":
+        if tag == GIRepository.TypeTag.ARRAY:
             array_type = GIRepository.type_info_get_array_type(t)
             # Only handle C arrays
             if array_type == GIRepository.ArrayType.C:
@@ -741,7 +812,7 @@ class FridaResolver(GIResolver):
             return {"name": "pointer", "subtype": None}
 
         # Check if it's an interface type
-        if tag == "interface":
+        if tag == GIRepository.TypeTag.INTERFACE:
             interface = GIRepository.type_info_get_interface(t)
             if interface:
                 info_type = interface.get_type()
@@ -760,28 +831,9 @@ class FridaResolver(GIResolver):
                         # Get struct size
                         struct_size = GIRepository.struct_info_get_size(interface)
                         return {"name": "struct", "subtype": None, "struct_size": struct_size}
-        if tag == "void" and GIRepository.type_info_is_pointer(t):
+        if tag == GIRepository.TypeTag.VOID and GIRepository.type_info_is_pointer(t):
             return {"name": "pointer", "subtype": None}
-        # Map GIRepository type tags to JSON type strings
-        type_map = {
-            "gboolean": "bool",
-            "gint8": "int8",
-            "guint8": "uint8",
-            "gint16": "int16",
-            "guint16": "uint16",
-            "gint32": "int32",
-            "guint32": "uint32",
-            "gint64": "int64",
-            "guint64": "uint64",
-            "utf8": "string",
-            "filename": "string",  # Filename strings (filesystem encoding)
-            "gfloat": "float",
-            "gdouble": "double",
-            "GType": "int64",  # FIXME beware of this
-            "void": "void",
-        }
-
-        json_type = type_map.get(tag, "pointer")
+        json_type = _TYPE_TAG_TO_JSON.get(tag, "pointer")
         return {"name": json_type, "subtype": None}
 
     def _arg_to_json(self, arg, is_method=False):
@@ -860,9 +912,9 @@ class FridaResolver(GIResolver):
         for i in range(n_args):
             arg = GIRepository.callable_info_get_arg(cb, i)
             arg_type = GIRepository.arg_info_get_type(arg)
-            tag = GIRepository.type_tag_to_string(GIRepository.type_info_get_tag(arg_type))
+            tag = GIRepository.type_info_get_tag(arg_type)
 
-            if tag == "array":
+            if tag == GIRepository.TypeTag.ARRAY:
                 array_type = GIRepository.type_info_get_array_type(arg_type)
                 if array_type == GIRepository.ArrayType.C:
                     length_idx = GIRepository.type_info_get_array_length(arg_type)
@@ -873,8 +925,8 @@ class FridaResolver(GIResolver):
 
         # Check return type for arrays with length parameters
         return_type = GIRepository.callable_info_get_return_type(cb)
-        return_tag = GIRepository.type_tag_to_string(GIRepository.type_info_get_tag(return_type))
-        if return_tag == "array":
+        return_tag = GIRepository.type_info_get_tag(return_type)
+        if return_tag == GIRepository.TypeTag.ARRAY:
             array_type = GIRepository.type_info_get_array_type(return_type)
             if array_type == GIRepository.ArrayType.C:
                 length_idx = GIRepository.type_info_get_array_length(return_type)
@@ -902,55 +954,79 @@ class FridaResolver(GIResolver):
         is_method = bool(flags & GIRepository.FunctionInfoFlags.IS_METHOD)
         return self._callable_to_json(method, is_method=is_method)
 
-    def _find_function_info(self, namespace, class_name, method_name):
-        """Find function info from operation_id"""
-        # operation_id format: {namespace}_{object_name}_{method_name}
-        # or {namespace}__{function_name} for standalone functions
+    def _index_namespace(self, namespace):
+        """
+        Index the functions, methods and types of a namespace by name, once.
+
+        Returns:
+            False if the namespace is not loaded, True otherwise
+        """
+        if namespace in self._indexed_namespaces:
+            return True
 
         # Check if namespace is loaded
         if not self.repo.is_registered(namespace, None):
-            logger.warning(f"Namespace '{namespace}' not loaded, cannot resolve method {method_name}")
-            return None
-
-        # Search through the repository
+            return False
+
+        method_getters = {
+            GIRepository.InfoType.OBJECT: (
+                GIRepository.object_info_get_n_methods,
+                GIRepository.object_info_get_method,
+            ),
+            GIRepository.InfoType.STRUCT: (
+                GIRepository.struct_info_get_n_methods,
+                GIRepository.struct_info_get_method,
+            ),
+            GIRepository.InfoType.ENUM: (GIRepository.enum_info_get_n_methods, GIRepository.enum_info_get_method),
+            GIRepository.InfoType.FLAGS: (GIRepository.enum_info_get_n_methods, GIRepository.enum_info_get_method),
+        }
+        # Keep the first match, as the previous linear search did
         n_infos = self.repo.get_n_infos(namespace)
         for i in range(n_infos):
             info = self.repo.get_info(namespace, i)
             info_type = info.get_type()
+            name = info.get_name()
 
             if info_type == GIRepository.InfoType.FUNCTION:
                 # Standalone function: namespace__function_name
-                if class_name is None and info.get_name() == method_name:
-                    return info
-            elif info_type == GIRepository.InfoType.OBJECT:
-                # Method: namespace_objectname_methodname
-                if class_name and info.get_name() == class_name:
-                    # Search for the method
-                    n_methods = GIRepository.object_info_get_n_methods(info)
-                    for j in range(n_methods):
-                        method = GIRepository.object_info_get_method(info, j)
-                        if method.get_name() == method_name:
-                            return method
-            elif info_type == GIRepository.InfoType.STRUCT:
-                # Method: namespace_objectname_methodname
-                if class_name and info.get_name() == class_name:
-                    # Search for the method
-                    n_methods = GIRepository.struct_info_get_n_methods(info)
-                    for j in range(n_methods):
-                        method = GIRepository.struct_info_get_method(info, j)
-                        if method.get_name() == method_name:
-                            return method
-            elif info_type in [GIRepository.InfoType.ENUM, GIRepository.InfoType.FLAGS]:
+                self._method_index.setdefault((namespace, None, name), info)
+            elif info_type in method_getters:
                 # Method: namespace_objectname_methodname
-                if class_name and info.get_name() == class_name:
-                    # Search for the method
-                    n_methods = GIRepository.enum_info_get_n_methods(info)
-                    for j in range(n_methods):
-                        method = GIRepository.enum_info_get_method(info, j)
-                        if method.get_name() == method_name:
-                            return method
+                self._type_index.setdefault((namespace, name), info)
+                get_n_methods, get_method = method_getters[info_type]
+                for j in range(get_n_methods(info)):
+                    method = get_method(info, j)
+                    self._method_index.setdefault((namespace, name, method.get_name()), method)
+
+        self._indexed_namespaces.add(namespace)
+        return True
+
+    def _find_field_info(self, namespace, struct_info, field_name):
+        """Find a struct field info, indexing all the fields of the struct on first use"""
+        key = (namespace, struct_info.get_name())
+        fields = self._field_index.get(key)
+        if fields is None:
+            fields = {}
+            for i in range(GIRepository.struct_info_get_n_fields(struct_info)):
+                field_info = GIRepository.struct_info_get_field(struct_info, i)
+                fields.setdefault(field_info.get_name(), field_info)
+            self._field_index[key] = fields
+        return fields.get(field_name)
 
-        return None
+    def _find_function_info(self, namespace, class_name, method_name):
+        """Find function info from operation_id"""
+        # operation_id format: {namespace}_{object_name}_{method_name}
+        # or {namespace}__{function_name} for standalone functions
+        if not self._index_namespace(namespace):
+            logger.warning(f"Namespace '{namespace}' not loaded, cannot resolve method {method_name}")
+            return None
+
+        return self._method_index.get((namespace, class_name, method_name))
+
+    async def _execute(self, command, headers):
+        """Execute a command on the message bus from a Frida thread, without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.message_bus.execute, command, headers)
 
     def _create_get_type_handler(self, type_info):
         symbol = GIRepository.registered_type_info_get_type_init(type_info)
@@ -962,14 +1038,17 @@ class FridaResolver(GIResolver):
 
         async def get_type_handler(*args, **kwargs):
             if symbol == "intern":
-                result = await asyncio.to_thread(self.scripts[0].exports_sync.internal_gtype, type_info.get_name())
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    self._executor, self.scripts[0].exports_sync.internal_gtype, type_info.get_name()
+                )
                 return {"return": result}
             else:
                 # Serialize the command
                 command = self.command_serializer.serialize_call(symbol, _type, [])
 
                 # Execute command (handles correlation ID internally)
-                result = await asyncio.to_thread(self.message_bus.execute, command, connexion.request.headers)
+                result = await self._execute(command, connexion.request.headers)
 
                 return result
 
@@ -990,7 +1069,7 @@ class FridaResolver(GIResolver):
             command = self.command_serializer.serialize_alloc(size)
 
             # Execute command (handles correlation ID internally)
-            result = await asyncio.to_thread(self.message_bus.execute, command, connexion.request.headers)
+            result = await self._execute(command, connexion.request.headers)
 
             return {"return": {"ptr": result}}
 
@@ -1011,7 +1090,7 @@ class FridaResolver(GIResolver):
             command = self.command_serializer.serialize_free(obj["ptr"])
 
             # Execute command (handles correlation ID internally)
-            await asyncio.to_thread(self.message_bus.execute, command, connexion.request.headers)
+            await self._execute(command, connexion.request.headers)
 
             return None
 
@@ -1065,7 +1144,7 @@ class FridaResolver(GIResolver):
             command = self.command_serializer.serialize_call(symbol, _type, [obj["ptr"]])
 
             # Execute command (handles correlation ID internally)
-            result = await asyncio.to_thread(self.message_bus.execute, command, connexion.request.headers)
+            result = await self._execute(command, connexion.request.headers)
 
             return {"return": {"ptr": result["return"]}}
 
@@ -1119,21 +1198,63 @@ class FridaResolver(GIResolver):
             command = self.command_serializer.serialize_call(symbol, _type, [obj["ptr"]])
 
             # Execute command (handles correlation ID internally)
-            await asyncio.to_thread(self.message_bus.execute, command, connexion.request.headers)
+            await self._execute(command, connexion.request.headers)
 
             return None
 
         return generic_unref_handler
 
-    def _parse_response(self, result, operation, field_type_info=None, method_info=None):
+    def _response_actions(self, operation, type_info=None):
         """
-        Parse and transform the response from Frida based on OpenAPI schema.
+        Precompute how each value of the response from Frida is transformed, based on OpenAPI schema.
 
         Args:
-            result: The raw result from Frida
             operation: The OpenAPI operation object
-            field_type_info: Optional GITypeInfo for field operations
-            method_info: Optional GICallableInfo for method operations (used for enum conversion)
+            type_info: Optional GITypeInfo of the field or the method return value
+                (used for array and enum conversion)
+
+        Returns:
+            List of (key, action, data) tuples to be used with _parse_response
+        """
+        # Check the spec about the response type to see if there are any structs or objects
+        # Take into account that the endpoint is already resolved
+        schema = operation.responses.get("200", {}).get("content", {}).get("application/json", {}).get("schema", {})
+        actions = []
+        for k, k_def in schema.get("properties", {}).items():
+            gi_type = k_def.get("x-gi-type")
+            # Handle single object/struct values
+            if gi_type in ["object", "struct", "gtype"] or k_def.get("type") == "object":
+                actions.append((k, _RESPONSE_POINTER, None))
+            # Convert enum integers back to strings for OpenAPI compliance
+            elif gi_type in ["enum", "flags"]:
+                interface = GIRepository.type_info_get_interface(type_info) if type_info else None
+                if interface:
+                    full_name = f"{interface.get_namespace()}{interface.get_name()}"
+                    actions.append((k, _RESPONSE_ENUM, self.enum_mappings_reverse.get(full_name, {})))
+            # Handle arrays - check if items are objects/structs using GI introspection
+            elif k_def.get("type") == "array" and type_info:
+                if GIRepository.type_info_get_tag(type_info) != GIRepository.TypeTag.ARRAY:
+                    continue
+                # Get the element type of the array
+                element_type_info = GIRepository.type_info_get_param_type(type_info, 0)
+                if not element_type_info:
+                    continue
+                # Check if element is an interface (object/struct/enum)
+                if GIRepository.type_info_get_tag(element_type_info) != GIRepository.TypeTag.INTERFACE:
+                    continue
+                interface = GIRepository.type_info_get_interface(element_type_info)
+                # Convert objects and structs to {ptr: "0x..."} format
+                if interface and interface.get_type() in [GIRepository.InfoType.OBJECT, GIRepository.InfoType.STRUCT]:
+                    actions.append((k, _RESPONSE_POINTER_ARRAY, None))
+        return actions
+
+    def _parse_response(self, result, actions):
+        """
+        Parse and transform the response from Frida.
+
+        Args:
+            result: The raw result from Frida
+            actions: The transformations as returned by _response_actions
 
         Returns:
             Transformed result with proper type conversions
@@ -1141,65 +1262,17 @@ class FridaResolver(GIResolver):
         if not result:
             return result
 
-        # Ok, now we have a response, check the spec about the response type to see if
-        # there are any structs or objects
-        for k, v in result.items():
-            responses = operation.responses
-            # Take into account that the endpoint is already resolved
-            k_def = responses["200"]["content"]["application/json"]["schema"]["properties"][k]
-
-            # Handle arrays - check if items are objects/structs using GI introspection
-            if "type" in k_def and k_def["type"] == "array" and isinstance(v, list):
-                # Use GI introspection to determine the array element type
-                type_info = field_type_info
-                if method_info and not field_type_info:
-                    # For method calls, get return type from method info
-                    type_info = GIRepository.callable_info_get_return_type(method_info)
-
-                if type_info:
-                    tag = GIRepository.type_tag_to_string(GIRepository.type_info_get_tag(type_info))
-                    if tag == "array":
-                        # Get the element type of the array
-                        element_type_info = GIRepository.type_info_get_param_type(type_info, 0)
-                        if element_type_info:
-                            element_tag = GIRepository.type_tag_to_string(
-                                GIRepository.type_info_get_tag(element_type_info)
-                            )
-
-                            # Check if element is an interface (object/struct/enum)
-                            if element_tag == "interface":
-                                interface = GIRepository.type_info_get_interface(element_type_info)
-                                if interface:
-                                    info_type = interface.get_type()
-                                    # Convert objects and structs to {ptr: "0x..."} format
-                                    if info_type in [GIRepository.InfoType.OBJECT, GIRepository.InfoType.STRUCT]:
-                                        logger.debug(
-                                            f"Converting array of {interface.get_name()} objects to {{ptr: ...}} format"
-                                        )
-                                        result[k] = [{"ptr": item} if isinstance(item, str) else item for item in v]
-
-            # Handle single object/struct values
-            if "x-gi-type" in k_def and k_def["x-gi-type"] in ["object", "struct", "gtype"]:
-                result[k] = {"ptr": v}
-            elif "type" in k_def and k_def["type"] == "object":
+        for k, action, data in actions:
+            if k not in result:
+                continue
+            v = result[k]
+            if action == _RESPONSE_POINTER:
                 result[k] = {"ptr": v}
-            # Convert enum integers back to strings for OpenAPI compliance
-            elif "x-gi-type" in k_def and k_def["x-gi-type"] in ["enum", "flags"]:
-                # Determine which type info to use
-                type_info = field_type_info
-                if method_info and not field_type_info:
-                    # For method calls, get return type from method info
-                    type_info = GIRepository.callable_info_get_return_type(method_info)
-
-                if type_info:
-                    interface = GIRepository.type_info_get_interface(type_info)
-                    full_name = f"{interface.get_namespace()}{interface.get_name()}"
-                    enum_mapping = self.enum_mappings.get(full_name, {})
-                    # Reverse lookup: find string name for integer value
-                    for enum_name, enum_value in enum_mapping.items():
-                        if enum_value == v:
-                            result[k] = enum_name
-                            break
+            elif action == _RESPONSE_ENUM:
+                # Reverse lookup: find string name for integer value
+                result[k] = data.get(v, v)
+            elif action == _RESPONSE_POINTER_ARRAY and isinstance(v, list):
+                result[k] = [{"ptr": item} if isinstance(item, str) else item for item in v]
         logger.debug(f"Returning converted response: {result}")
         return result
 
@@ -1219,6 +1292,7 @@ class FridaResolver(GIResolver):
                 field_type_json_item = self._type_to_json(field_type)
                 fields.append({"name": field_info.get_name(), "offset": field_offset, "type": field_type_json_item})
             struct_type_info = {"fields": fields}
+        response_actions = self._response_actions(operation, field_type_info)
 
         async def field_get_handler(*args, **kwargs):
             # Extract the self parameter (struct pointer)
@@ -1232,13 +1306,15 @@ class FridaResolver(GIResolver):
             command = self.command_serializer.serialize_get_field(obj["ptr"], offset, field_type_json, struct_type_info)
 
             # Execute command (handles correlation ID internally)
-            raw_result = await asyncio.to_thread(self.message_bus.execute, command, connexion.request.headers)
+            raw_result = await self._execute(command, connexion.request.headers)
 
             # Wrap in result dictionary
             result = {"return": raw_result}
 
             # Use common response parsing logic
-            return self._parse_response(result, operation, field_type_info)
+            if not response_actions:
+                return result
+            return self._parse_response(result, response_actions)
 
         return field_get_handler
 
@@ -1266,7 +1342,7 @@ class FridaResolver(GIResolver):
             command = self.command_serializer.serialize_set_field(obj["ptr"], offset, field_type_json, value)
 
             # Execute command (handles correlation ID internally)
-            await asyncio.to_thread(self.message_bus.execute, command, connexion.request.headers)
+            await self._execute(command, connexion.request.headers)
 
             return None
 
@@ -1275,8 +1351,7 @@ class FridaResolver(GIResolver):
     # Custom methods
     def custom_glib_list_free(self):
         async def func(*args, **kwargs):
-            converted_kwargs = {}
-            converted_kwargs["this"] = kwargs["self"]["ptr"]
+            converted_args = [kwargs["self"]["ptr"]]
             _type = {
                 "arguments": [],
                 "is_method": True,
@@ -1297,10 +1372,10 @@ class FridaResolver(GIResolver):
             _type["arguments"].append(ra)
 
             # Serialize the command
-            command = self.command_serializer.serialize_call("g_list_free", _type, list(converted_kwargs.values()))
+            command = self.command_serializer.serialize_call("g_list_free", _type, converted_args)
 
             # Execute command (handles correlation ID internally)
-            await asyncio.to_thread(self.message_bus.execute, command, connexion.request.headers)
+            await self._execute(command, connexion.request.headers)
 
         return func
 
@@ -1405,6 +1480,10 @@ class FridaResolver(GIResolver):
             "returns": {"name": "uint64", "subtype": None},  # gulong return type
         }
 
+        # Mapping used to convert GObjectConnectFlags from string to integer
+        flags_full_name = f"{connect_flags_info.get_namespace()}{connect_flags_info.get_name()}"
+        flags_mapping = self.enum_mappings.get(flags_full_name, {})
+
         async def signal_connect_handler(*args, **kwargs):
             # Debug: Print what we're receiving
             logger.debug(f"signal_connect_handler called with args={args}, kwargs={kwargs}")
@@ -1440,9 +1519,7 @@ class FridaResolver(GIResolver):
             session_id = headers.get("session-id")
             callback_secret = headers.get("callback-secret")
 
-            # Convert GObjectConnectFlags from string to integer using enum_mappings
-            full_name = f"{connect_flags_info.get_namespace()}{connect_flags_info.get_name()}"
-            flags_mapping = self.enum_mappings.get(full_name, {})
+            # Convert GObjectConnectFlags from string to integer
             connect_flags = flags_mapping.get(flags_str, 0)
 
             # Register the callback with the signal signature for proper marshalling
@@ -1462,27 +1539,45 @@ class FridaResolver(GIResolver):
             command = self.command_serializer.serialize_call("g_signal_connect_data", connect_func_signature, args)
 
             # Execute command (handles correlation ID internally)
-            result = await asyncio.to_thread(self.message_bus.execute, command, connexion.request.headers)
+            result = await self._execute(command, connexion.request.headers)
 
             return result
 
         return signal_connect_handler
 
-    # TODO what to access here, the info from GI (_method) or the type info for Frida (_type)
-    def create_frida_handler(self):
+    def create_frida_handler(self, method_info, method_json, operation):
         """Create handler that calls Frida with the method JSON, converting enum strings to integers,
         objects to pointers, etc.
+
+        Args:
+            method_info: GI's BaseInfo of the method
+            method_json: The JSON representation of the GI information
+            operation: The OpenAPI endpoint entry
         """
+        # Resolve everything the handler needs from GI once, not on every request
+        symbol = GIRepository.function_info_get_symbol(method_info)
+        is_method = method_json["is_method"]
+        prepared_args = [
+            self._prepare_arg_from_rest(GIRepository.callable_info_get_arg(method_info, i))
+            for i in range(GIRepository.callable_info_get_n_args(method_info))
+        ]
+        return_type = GIRepository.callable_info_get_return_type(method_info)
+        response_actions = self._response_actions(operation, return_type)
+
+        # Determine if this is a void function using the JSON representation
+        # Check return type - returns is a dict like {"name": "void", "subtype": None}
+        returns_void = method_json.get("returns", {}).get("name") == "void"
+
+        # Check for output parameters
+        has_out_params = any(
+            arg.get("direction") in [GIRepository.Direction.OUT, GIRepository.Direction.INOUT]
+            for arg in method_json.get("arguments", [])
+        )
 
-        async def frida_resolver_handler(_method=None, _type=None, _endpoint=None, *args, **kwargs):
-            """Call Frida to the actual call the symbol
-            The method receives the GI's BaseInfo (_method)
-            The JSON representation of the GI information (_type)
-            The OpenAPI endpoint entry
-            """
-            # Get the symbol from the method info
-            symbol = GIRepository.function_info_get_symbol(_method)
+        is_true_void = returns_void and not has_out_params
 
+        async def frida_resolver_handler(*args, **kwargs):
+            """Call Frida to the actual call the symbol"""
             # Headers
             headers = connexion.request.headers
 
@@ -1493,18 +1588,6 @@ class FridaResolver(GIResolver):
             prefer_header = headers.get("Prefer", "")
             is_async_requested = "respond-async" in prefer_header
 
-            # Determine if this is a void function using _type (JSON representation)
-            # Check return type - returns is a dict like {"name": "void", "subtype": None}
-            returns_void = _type.get("returns", {}).get("name") == "void"
-
-            # Check for output parameters
-            has_out_params = any(
-                arg.get("direction") in [GIRepository.Direction.OUT, GIRepository.Direction.INOUT]
-                for arg in _type.get("arguments", [])
-            )
-
-            is_true_void = returns_void and not has_out_params
-
             # If async execution is requested but function is not void, reject it
             if is_async_requested and not is_true_void:
                 return {
@@ -1512,24 +1595,22 @@ class FridaResolver(GIResolver):
                 }, 400
 
             # Convert enum string values to integers before calling Frida
-            converted_kwargs = {}
-            n_args = GIRepository.callable_info_get_n_args(_method)
+            converted_args = []
 
             # Add 'self' as a parameter
-            if _type["is_method"]:
-                converted_kwargs["this"] = kwargs["self"]["ptr"]
+            if is_method:
+                converted_args.append(kwargs["self"]["ptr"])
 
-            for i in range(n_args):
-                arg = GIRepository.callable_info_get_arg(_method, i)
-                arg_name = arg.get_name()
+            for arg in prepared_args:
+                arg_name = arg[0]
 
                 # Some args might not be on the passed in args, like output params
                 if arg_name in kwargs:
-                    converted_kwargs[arg_name] = self._arg_from_rest(kwargs[arg_name], arg, headers)
+                    converted_args.append(self._arg_from_rest(kwargs[arg_name], arg, headers))
 
             # Serialize the command
             command = self.command_serializer.serialize_call(
-                symbol=symbol, method_info=_type, args=list(converted_kwargs.values())
+                symbol=symbol, method_info=method_json, args=converted_args
             )
 
             # Handle async execution (fire-and-forget)
@@ -1542,14 +1623,14 @@ class FridaResolver(GIResolver):
                     # Async queued execution (thread affinity + fire-and-forget)
                     logger.debug(f"Async queued execution for correlation_id={correlation_id}")
                     # Send immediately (synchronous post, but async execution on Frida side)
-                    self.message_bus.execute_queued(command, correlation_id, is_async=True)
+                    self.message_bus.execute(command, headers, is_async=True)
                     # Return 202 immediately without waiting
                     return "", 202, {"Preference-Applied": "respond-async"}
                 else:
                     # Async direct execution (no thread affinity)
                     async def execute_async():
                         try:
-                            await asyncio.to_thread(self.message_bus.execute_direct, command)
+                            await self._execute(command, headers)
                         except Exception as e:
                             logger.error(f"Async execution failed for {symbol}: {e}")
 
@@ -1557,10 +1638,11 @@ class FridaResolver(GIResolver):
                     return "", 202, {"Preference-Applied": "respond-async"}
 
             # Execute command via appropriate channel (synchronous execution)
-            result = await asyncio.to_thread(self.message_bus.execute, command, headers)
+            result = await self._execute(command, headers)
 
             # Use common response parsing logic
-            result = self._parse_response(result, _endpoint, method_info=_method)
+            if response_actions:
+                result = self._parse_response(result, response_actions)
 
             return result
 
@@ -1568,6 +1650,17 @@ class FridaResolver(GIResolver):
 
     def get_function_from_operation(self, operation):
         """Resolve function from operation_id and return handler"""
+        # Connexion resolves every operation once per middleware, create each handler only once
+        operation_id = operation.operation_id
+        if operation_id in self._handlers:
+            return self._handlers[operation_id]
+
+        ret = self._create_handler(operation)
+        self._handlers[operation_id] = ret
+        return ret
+
+    def _create_handler(self, operation):
+        """Create the handler of an operation"""
         ret = super().get_function_from_operation(operation)
         if ret:
             return ret
@@ -1596,50 +1689,39 @@ class FridaResolver(GIResolver):
             field_name = method_name
 
             # Find the struct info
-            struct_info = None
-            # Check if namespace is loaded
-            if not self.repo.is_registered(namespace, None):
+            if not self._index_namespace(namespace):
                 logger.warning(f"Namespace '{namespace}' not loaded, skipping field operation for {method_name}")
                 return None
-            n_infos = self.repo.get_n_infos(namespace)
-            for i in range(n_infos):
-                info = self.repo.get_info(namespace, i)
-                if info.get_type() == GIRepository.InfoType.STRUCT and info.get_name() == class_name:
-                    struct_info = info
-                    break
+            struct_info = self._type_index.get((namespace, class_name))
+            if struct_info and struct_info.get_type() != GIRepository.InfoType.STRUCT:
+                struct_info = None
 
             if struct_info:
                 # Find the field info
-                n_fields = GIRepository.struct_info_get_n_fields(struct_info)
-                for i in range(n_fields):
-                    field_info = GIRepository.struct_info_get_field(struct_info, i)
-                    if field_info.get_name() == field_name:
-                        # Extract field metadata
-                        field_offset = GIRepository.field_info_get_offset(field_info)
-                        field_flags = GIRepository.field_info_get_flags(field_info)
-                        is_writable = bool(field_flags & GIRepository.FieldInfoFlags.WRITABLE)
-                        field_type_info = GIRepository.field_info_get_type(field_info)
-                        field_type_json = self._type_to_json(field_type_info)
-
-                        if operator == "get":
-                            return self._create_field_get_handler(
-                                field_offset, field_type_json, field_type_info, operation, struct_info
-                            )
-                        elif operator == "put" and is_writable:
-                            return self._create_field_put_handler(
-                                field_offset, field_type_json, field_type_info, operation
-                            )
-
-                        return None
+                field_info = self._find_field_info(namespace, struct_info, field_name)
+                if field_info:
+                    # Extract field metadata
+                    field_offset = GIRepository.field_info_get_offset(field_info)
+                    field_flags = GIRepository.field_info_get_flags(field_info)
+                    is_writable = bool(field_flags & GIRepository.FieldInfoFlags.WRITABLE)
+                    field_type_info = GIRepository.field_info_get_type(field_info)
+                    field_type_json = self._type_to_json(field_type_info)
+
+                    if operator == "get":
+                        return self._create_field_get_handler(
+                            field_offset, field_type_json, field_type_info, operation, struct_info
+                        )
+                    elif operator == "put" and is_writable:
+                        return self._create_field_put_handler(field_offset, field_type_json, field_type_info, operation)
+
+                    return None
 
         method_info = self._find_function_info(namespace, class_name, method_name)
         if method_info:
             # Generate the JSON representation
             method_json = self._method_to_json(method_info)
-
-            # Create and return the handler with method_info and method_json as defaults
-            ret = self.create_frida_handler()
-            ret.__defaults__ = (method_info, method_json, operation)
+            # Create and return the handler for this method
+            ret = self.create_frida_handler(method_info, method_json, operation)
             return ret
         # Custom cases when a function is not exported by GI
         # In the case of GLibList the free function is not exported by GI, so we need to create it manually
@@ -1648,28 +1730,10 @@ class FridaResolver(GIResolver):
         # Check for the artificial methods
         elif method_name in ["new", "free", "get_type", "ref", "unref"]:
             # Try to find the info (struct, object, enum, or flags)
-            type_info = None
-            # Check if namespace is loaded
-            if not self.repo.is_registered(namespace, None):
+            if not self._index_namespace(namespace):
                 logger.warning(f"Namespace '{namespace}' not loaded, skipping artificial method {method_name}")
                 return None
-            n_infos = self.repo.get_n_infos(namespace)
-            for i in range(n_infos):
-                info = self.repo.get_info(namespace, i)
-                info_type = info.get_type()
-                # Check for struct, object, enum, or flags that match the class name
-                if (
-                    info_type
-                    in [
-                        GIRepository.InfoType.STRUCT,
-                        GIRepository.InfoType.OBJECT,
-                        GIRepository.InfoType.ENUM,
-                        GIRepository.InfoType.FLAGS,
-                    ]
-                    and info.get_name() == class_name
-                ):
-                    type_info = info
-                    break
+            type_info = self._type_index.get((namespace, class_name))
 
             if type_info:
                 if method_name == "new":
@@ -1,5 +1,5 @@
 """
-Custom URI parser for GIRest that uses uritemplate to handle complex parameter serialization.
+Custom URI parser for GIRest that handles complex parameter serialization.
 
 This parser extends Connexion's OpenAPIURIParser to properly handle:
 - allOf, anyOf, oneOf schema combinations
@@ -8,21 +8,33 @@ This parser extends Connexion's OpenAPIURIParser to properly handle:
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
-import uritemplate
+from connexion.exceptions import TypeValidationError
 from connexion.uri_parsing import OpenAPIURIParser
+from connexion.utils import coerce_type, is_nullable
 
 logger = logging.getLogger("girest.uri_parser")
 
+# JSON Schema composition keywords
+_COMPOSITION_KEYS = frozenset(("allOf", "anyOf", "oneOf"))
+
+# Schema types coerce_type converts values to, it leaves any other value as is
+_COERCED_TYPES = frozenset(("integer", "number", "boolean", "object", "array"))
+
+# How a parameter value is resolved
+_SCALAR = 0
+_ARRAY = 1
+_OBJECT = 2
+
 
 class URITemplateParser(OpenAPIURIParser):
     """
-    URI parser that uses the uritemplate library to parse complex URI patterns.
+    URI parser that parses complex URI patterns.
 
     This parser inherits from OpenAPIURIParser and overrides the parameter resolution
-    to use URI templates for more robust parsing of query and path parameters,
-    particularly when dealing with object types and complex serialization formats.
+    for more robust parsing of query and path parameters, particularly when dealing
+    with object types and complex serialization formats.
     """
 
     def __init__(self, param_defns, body_defn):
@@ -33,49 +45,31 @@ class URITemplateParser(OpenAPIURIParser):
         :param body_defn: Body definition from the OpenAPI spec
         """
         super().__init__(param_defns, body_defn)
-        # Build URI templates for each parameter
-        self._uri_templates = self._build_uri_templates()
+        # Classify each parameter once, instead of for every value resolved
+        self._plans = self._build_plans()
 
-    def _build_uri_templates(self) -> Dict[str, uritemplate.URITemplate]:
+    def _build_plans(self) -> Dict[str, Tuple[int, Dict, bool]]:
         """
-        Build URI templates for each parameter based on their style and explode settings.
+        Build the resolution plan of each parameter.
 
-        :return: Dictionary mapping parameter names to URI templates
+        :return: Dictionary mapping parameter names to (kind, param_defn, needs_coercion)
         """
-        templates = {}
-
+        plans = {}
         for param_name, param_defn in self._param_defns.items():
-            param_in = param_defn.get("in")
-
-            # Only build templates for query and path parameters
-            if param_in not in ["query", "path"]:
-                continue
-
-            # Get style and explode from parameter definition
-            default_style = self.style_defaults.get(param_in, "simple")
-            style = param_defn.get("style", default_style)
-            is_form = style == "form"
-            explode = param_defn.get("explode", is_form)
-
-            # Build the appropriate template syntax based on style and explode
-            if style == "form" and explode:
-                # Form style with explode expands object properties
-                template_str = f"{{{param_name}*}}"
-            elif style == "form":
-                # Form style without explode uses comma-separated values
-                template_str = f"{{{param_name}}}"
-            elif style == "simple" and explode:
-                template_str = f"{{{param_name}*}}"
+            param_schema = param_defn.get("schema", {})
+            if param_schema.get("type") == "array":
+                kind = _ARRAY
+            # Check if this is an object type with allOf/anyOf/oneOf or $ref
+            elif self._is_object_schema(param_schema):
+                kind = _OBJECT
             else:
-                # Default simple style
-                template_str = f"{{{param_name}}}"
-
-            try:
-                templates[param_name] = uritemplate.URITemplate(template_str)
-            except Exception as e:
-                logger.warning(f"Failed to create URI template for {param_name}: {e}")
-
-        return templates
+                kind = _SCALAR
+            # Strings, composed and $ref schemas are only coerced when nullable, "null" becomes None
+            needs_coercion = param_schema.get("type") in _COERCED_TYPES or is_nullable(
+                param_defn.get("schema", param_defn)
+            )
+            plans[param_name] = (kind, param_defn, needs_coercion)
+        return plans
 
     def _is_object_schema(self, param_schema: Dict) -> bool:
         """
@@ -92,20 +86,13 @@ class URITemplateParser(OpenAPIURIParser):
         if not param_schema:
             return False
 
-        # Direct object type
-        if param_schema.get("type") == "object":
-            return True
-
-        # Complex schemas (allOf, anyOf, oneOf)
-        if any(key in param_schema for key in ["allOf", "anyOf", "oneOf"]):
-            return True
-
-        # Schemas with $ref are treated as potentially objects
+        # Direct object type, complex schemas (allOf, anyOf, oneOf) or schemas with $ref
         # We can't easily resolve the ref here, so we'll try to parse it
-        if "$ref" in param_schema:
-            return True
-
-        return False
+        return (
+            param_schema.get("type") == "object"
+            or not _COMPOSITION_KEYS.isdisjoint(param_schema)
+            or "$ref" in param_schema
+        )
 
     def _parse_object_from_string(self, value: str, param_defn: Dict, _in: str) -> Any:
         """
@@ -135,89 +122,124 @@ class URITemplateParser(OpenAPIURIParser):
 
         # For style=simple or style=form with explode=false
         # Object format is "prop1,val1,prop2,val2,..."
-        if not explode and "," in value:
-            parts = value.split(",")
-            # Must have even number of parts (property-value pairs)
-            if len(parts) >= 2 and len(parts) % 2 == 0:
-                obj = {}
-                for i in range(0, len(parts), 2):
-                    obj[parts[i]] = parts[i + 1]
-                return obj
+        # Must have an odd number of commas (property-value pairs)
+        if not explode and value.count(",") % 2 == 1:
+            obj = {}
+            start = 0
+            while True:
+                key_end = value.find(",", start)
+                value_end = value.find(",", key_end + 1)
+                if value_end == -1:
+                    obj[value[start:key_end]] = value[key_end + 1 :]
+                    return obj
+                obj[value[start:key_end]] = value[key_end + 1 : value_end]
+                start = value_end + 1
 
         # If it doesn't match the pattern, return as-is
         return value
 
-    def _parse_with_template(self, param_name: str, value: Any, param_defn: Dict, _in: str) -> Any:
+    def resolve_params(self, params, _in):
         """
-        Parse a parameter value using URI template extraction if available.
+        Resolve parameters using URI template aware parsing.
 
-        :param param_name: Name of the parameter
-        :param value: Raw value from the request
-        :param param_defn: Parameter definition from the spec
-        :param _in: Parameter location (path/query)
-        :return: Parsed value
+        This method extends the parent class for better handling of
+        complex parameter types.
+
+        :param params: Dictionary of raw parameter values
+        :param _in: Parameter location (query, path, etc.)
+        :return: Resolved parameters
         """
-        # For string values, try to parse as serialized objects
-        if isinstance(value, str):
-            return self._parse_object_from_string(value, param_defn, _in)
+        if _in == "path":
+            return self._resolve_path_params(params)
+        return self._resolve_query_params(params, _in)
 
-        # For other types, return as-is
-        return value
+    def _resolve_path_params(self, params):
+        """
+        Resolve path parameters, each one has a single value.
 
-    def resolve_params(self, params, _in):
+        :param params: Dictionary of raw parameter values
+        :return: Resolved parameters
         """
-        Resolve parameters using URI template aware parsing.
+        resolved_param = {}
+
+        for k, value in params.items():
+            plan = self._plans.get(k)
+
+            if plan is None:
+                # rely on validation
+                resolved_param[k] = value
+                continue
+
+            kind, param_defn, needs_coercion = plan
+
+            # Handle array types
+            if kind == _ARRAY:
+                # handle array styles
+                value = self._split(value, param_defn, "path")
+            # Handle object types and complex schemas (including $ref)
+            elif kind == _OBJECT:
+                value = self._parse_object_from_string(value, param_defn, "path")
+
+            if needs_coercion:
+                value = self._coerce_param(k, value, param_defn)
+            resolved_param[k] = value
+
+        return resolved_param
 
-        This method extends the parent class to use URI templates for
-        better handling of complex parameter types.
+    def _resolve_query_params(self, params, _in):
+        """
+        Resolve query-like parameters, each one has a list of values.
 
         :param params: Dictionary of raw parameter values
-        :param _in: Parameter location (query, path, etc.)
+        :param _in: Parameter location (query, form, etc.)
         :return: Resolved parameters
         """
         resolved_param = {}
 
         for k, values in params.items():
-            param_defn = self.param_defns.get(k)
-            param_schema = self.param_schemas.get(k)
+            plan = self._plans.get(k)
 
-            if not (param_defn or param_schema):
+            if plan is None:
                 # rely on validation
                 resolved_param[k] = values
                 continue
 
-            if _in == "path":
-                # multiple values in a path is impossible
-                values = [values]
-
-            # Check if this is an object type with allOf/anyOf/oneOf or $ref
-            is_complex_schema = self._is_object_schema(param_schema)
+            kind, param_defn, needs_coercion = plan
 
             # Handle array types
-            if param_schema and param_schema.get("type") == "array":
+            if kind == _ARRAY:
                 # resolve variable re-assignment, handle explode
                 values = self._resolve_param_duplicates(values, param_defn, _in)
                 # handle array styles
-                resolved_param[k] = self._split(values, param_defn, _in)
+                value = self._split(values, param_defn, _in)
             # Handle object types and complex schemas (including $ref)
-            elif is_complex_schema:
+            elif kind == _OBJECT:
                 # Extract the value from list if needed
-                value_to_parse = values[-1] if isinstance(values, list) else values
+                value = values[-1] if isinstance(values, list) else values
 
-                # For objects, use template-based parsing
-                parsed_value = self._parse_with_template(k, value_to_parse, param_defn, _in)
-                resolved_param[k] = parsed_value
+                # For string values, try to parse as serialized objects
+                value = self._parse_object_from_string(value, param_defn, _in)
             else:
                 # Standard scalar handling
-                resolved_param[k] = values[-1]
-
-            # Type coercion is handled by parent class
-            try:
-                from connexion.exceptions import TypeValidationError
-                from connexion.utils import coerce_type
+                value = values[-1]
 
-                resolved_param[k] = coerce_type(param_defn, resolved_param[k], "parameter", k)
-            except TypeValidationError:
-                pass
+            if needs_coercion:
+                value = self._coerce_param(k, value, param_defn)
+            resolved_param[k] = value
 
         return resolved_param
+
+    @staticmethod
+    def _coerce_param(param_name, value, param_defn):
+        """
+        Coerce a resolved value to the type of its parameter, if possible.
+
+        :param param_name: Name of the parameter
+        :param value: The resolved value
+        :param param_defn: Parameter definition from the spec
+        :return: Coerced value, or the value as is if it can not be coerced
+        """
+        try:
+            return coerce_type(param_defn, value, "parameter", param_name)
+        except TypeValidationError:
+            return value
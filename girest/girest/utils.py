@@ -2,7 +2,21 @@
 Utility functions shared across GIRest modules.
 """
 
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
+
+class OperationId(NamedTuple):
+    """The parts of an operation_id, see parse_operation_id"""
+
+    namespace: str
+    class_name: Optional[str]
+    method_name: str
+    operator: Optional[str]
+
+
+# The set of operation ids is bounded by the OpenAPI schema
+@lru_cache(maxsize=None)
 def parse_operation_id(operation_id):
     """Parse operation_id into namespace, class/struct name, method/field name, and optional operator.
 
@@ -10,7 +24,7 @@ def parse_operation_id(operation_id):
         operation_id: The operation ID string to parse (format: namespace-class-method or namespace-class-field-operator)
 
     Returns:
-        tuple: (namespace, class_name, method_name, operator) or None if invalid format
+        OperationId: (namespace, class_name, method_name, operator) or None if invalid format
         For standalone functions: (namespace, None, method_name, None)
         For methods: (namespace, class_name, method_name, None)
         For field operations: (namespace, class_name, field_name, operator)
@@ -19,39 +33,38 @@ def parse_operation_id(operation_id):
 
     Examples:
         >>> parse_operation_id("Gst-Buffer-new")
-        ('Gst', 'Buffer', 'new', None)
+        OperationId(namespace='Gst', class_name='Buffer', method_name='new', operator=None)
 
         >>> parse_operation_id("Gst-Buffer-pts-get")
-        ('Gst', 'Buffer', 'pts', 'get')
+        OperationId(namespace='Gst', class_name='Buffer', method_name='pts', operator='get')
 
         >>> parse_operation_id("Gst-Buffer-pts-put")
-        ('Gst', 'Buffer', 'pts', 'put')
+        OperationId(namespace='Gst', class_name='Buffer', method_name='pts', operator='put')
 
         >>> parse_operation_id("Gst--version")
-        ('Gst', None, 'version', None)
+        OperationId(namespace='Gst', class_name=None, method_name='version', operator=None)
 
         >>> parse_operation_id("invalid")
         None
     """
-    if not operation_id:
+    if not operation_id or "-" not in operation_id:
         return None
 
-    parts = operation_id.split("-")
-    if len(parts) < 2:
-        return None
+    # At most 4 parts are valid, stop splitting once there are more
+    parts = operation_id.split("-", 4)
 
     if len(parts) == 4:
         # Field operation: namespace-class-field-operator
         class_name = parts[1] if parts[1] else None
-        return (parts[0], class_name, parts[2], parts[3])
+        return OperationId(parts[0], class_name, parts[2], parts[3])
 
     if len(parts) == 3:
         # Method: namespace-class-method
         class_name = parts[1] if parts[1] else None
-        return (parts[0], class_name, parts[2], None)
+        return OperationId(parts[0], class_name, parts[2], None)
 
     if len(parts) == 2:
         # Standalone function: namespace-function
-        return (parts[0], None, parts[1], None)
+        return OperationId(parts[0], None, parts[1], None)
 
     return None
@@ -6,13 +6,27 @@ patterns used in the GIRest API, particularly for handling GObject introspection
 """
 
 import logging
-from typing import Dict
+from typing import Dict, Tuple
 
+from connexion.utils import is_null, is_nullable
 from connexion.validators.parameter import ParameterValidator
 from jsonschema import Draft4Validator, ValidationError
 
 logger = logging.getLogger("girest.validators")
 
+try:
+    _FORMAT_CHECKER = Draft4Validator.FORMAT_CHECKER  # type: ignore
+except AttributeError:  # jsonschema < 4.5.0
+    from jsonschema import draft4_format_checker
+
+    _FORMAT_CHECKER = draft4_format_checker
+
+# JSON Schema composition keywords
+_COMPOSITION_KEYS = frozenset(("allOf", "anyOf", "oneOf"))
+
+# Validators by schema id, the schema is kept alongside so its id can not be reused
+_validators: Dict[int, Tuple[Dict, Draft4Validator]] = {}
+
 
 class GIRestParameterValidator(ParameterValidator):
     """
@@ -27,20 +41,21 @@ class GIRestParameterValidator(ParameterValidator):
     def _create_validator_with_defaults(schema: Dict) -> Draft4Validator:
         """
         Create a JSON Schema validator that properly handles composition keywords.
+        Validators are cached per schema.
 
         :param schema: The JSON schema to validate against
         :return: A configured Draft4Validator instance
         """
+        # Schemas come from the loaded spec and do not change, reuse their validators
+        cached = _validators.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
         # Create a validator class that supports all composition keywords
         # The Draft4Validator already supports allOf, anyOf, and oneOf
-        try:
-            format_checker = Draft4Validator.FORMAT_CHECKER  # type: ignore
-        except AttributeError:  # jsonschema < 4.5.0
-            from jsonschema import draft4_format_checker
-
-            format_checker = draft4_format_checker
-
-        return Draft4Validator(schema, format_checker=format_checker)
+        validator = Draft4Validator(schema, format_checker=_FORMAT_CHECKER)
+        _validators[id(schema)] = (schema, validator)
+        return validator
 
     @staticmethod
     def validate_parameter(parameter_type, value, param, param_name=None):
@@ -53,15 +68,11 @@ class GIRestParameterValidator(ParameterValidator):
         :param param_name: Optional parameter name for error messages
         :return: Error message if validation fails, None otherwise
         """
-        from connexion.utils import is_null, is_nullable
-
         if is_nullable(param) and is_null(value):
             return
 
         elif value is not None:
-            import copy
-
-            param = copy.deepcopy(param)
+            # The schema is only read, no need to copy it
             param_schema = param.get("schema", param)
 
             try:
@@ -70,7 +81,7 @@ class GIRestParameterValidator(ParameterValidator):
                 validator.validate(value)
             except ValidationError as exception:
                 # Provide more detailed error messages for composition keywords
-                if any(keyword in param_schema for keyword in ["allOf", "anyOf", "oneOf"]):
+                if not _COMPOSITION_KEYS.isdisjoint(param_schema):
                     logger.debug(
                         f"Validation failed for {parameter_type} parameter with " f"composition schema: {exception}"
                     )
@@ -4,48 +4,52 @@ Pytest configuration and fixtures for GIRest tests.
 """
 
 import os
+import re
 import shutil
-import sys
 import tempfile
 
 import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 from girest.generator import TypeScriptGenerator
 from girest.main import GIRest
 
+# Class and interface declarations in the generated TypeScript
+_DECLARATION_RE = re.compile(r"^export (?:class|interface) (\w+)", re.MULTILINE)
+
 
 @pytest.fixture(scope="session")
-def gst_schema():
+def gst_schema(gst_girest):
     """
     Generate OpenAPI schema for Gst namespace.
 
     Session-scoped for performance - schema generation is expensive and the schema
     is not modified by any tests.
 
+    Args:
+        gst_girest: GIRest instance fixture for Gst namespace
+
     Returns:
         dict: OpenAPI schema dictionary for Gst 1.0
     """
-    girest = GIRest("Gst", "1.0")
-    spec = girest.generate()
+    spec = gst_girest.generate()
     return spec.to_dict()
 
 
 @pytest.fixture(scope="session")
-def gobject_schema():
+def gobject_schema(gobject_girest):
     """
     Generate OpenAPI schema for GObject namespace.
 
     Session-scoped for performance - schema generation is expensive and the schema
     is not modified by any tests.
 
+    Args:
+        gobject_girest: GIRest instance fixture for GObject namespace
+
     Returns:
         dict: OpenAPI schema dictionary for GObject 2.0
     """
-    girest = GIRest("GObject", "2.0")
-    spec = girest.generate()
+    spec = gobject_girest.generate()
     return spec.to_dict()
 
 
@@ -81,53 +85,53 @@ def gst_typescript(gst_schema, session_tmp_dir):
     return ts_gen.generate(session_tmp_dir)
 
 
-def find_class_in_files(files_dict: dict, class_name: str) -> str:
+@pytest.fixture(scope="session")
+def gst_classes(gst_typescript):
     """
-    Helper function to find a class definition in the generated TypeScript files.
+    Index the generated Gst TypeScript files by the classes they declare.
+
+    The files are scanned once per session so tests get the file of a class
+    with a dictionary lookup. A class is mapped to the file named after it
+    (e.g. /path/Gst/GstPipeline.ts) or, failing that, to the first file that
+    declares it as a class or interface.
 
     Args:
-        files_dict: Dictionary mapping file paths to TypeScript content
-        class_name: Name of the class to find
+        gst_typescript: TypeScript files fixture for Gst namespace
 
     Returns:
-        The content of the file containing the class, or empty string if not found
+        Dict[str, str]: Dictionary mapping class names to the content of their file
     """
-    # First try to find exact match by filename
-    for file_path, content in files_dict.items():
-        # Check if the file is named exactly as the class (e.g., /path/Gst/GstPipeline.ts)
-        if file_path.endswith(f"/{class_name}.ts"):
-            return content
-
-    # Fallback: search by class declaration
-    for file_path, content in files_dict.items():
-        # Look for exact class name (not as part of another name)
-        if f"export class {class_name} " in content or f"export interface {class_name} " in content:
-            # Make sure it's not GstPipelineClass when looking for GstPipeline
-            # Check that it's followed by { or extends, not more letters
-            import re
-
-            pattern = rf"export (?:class|interface) {re.escape(class_name)}[\s{{]"
-            if re.search(pattern, content):
-                return content
-    return ""
-
-
-@pytest.fixture
+    classes = {}
+    for file_path, content in gst_typescript.items():
+        classes.setdefault(os.path.splitext(os.path.basename(file_path))[0], content)
+    for content in gst_typescript.values():
+        for class_name in _DECLARATION_RE.findall(content):
+            classes.setdefault(class_name, content)
+    return classes
+
+
+@pytest.fixture(scope="session")
 def gst_girest():
     """
     Create a GIRest instance for Gst namespace.
 
+    Session-scoped for performance - loading the typelib is expensive and the
+    instance is only inspected by the tests.
+
     Returns:
         GIRest: GIRest instance for Gst 1.0
     """
     return GIRest("Gst", "1.0")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gobject_girest():
     """
     Create a GIRest instance for GObject namespace.
 
+    Session-scoped for performance - loading the typelib is expensive and the
+    instance is only inspected by the tests.
+
     Returns:
         GIRest: GIRest instance for GObject 2.0
     """
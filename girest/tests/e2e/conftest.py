@@ -10,9 +10,9 @@ These fixtures manage the lifecycle of:
 
 import asyncio
 import os
+import select
 import signal
 import subprocess
-import sys
 import tempfile
 import threading
 import time
@@ -21,10 +21,6 @@ import httpx
 import pytest
 from aiohttp import web
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-
-
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -85,6 +81,38 @@ def inject_correlation_id_header(headers=None):
     return headers
 
 
+def _wait_process(process, timeout):
+    """
+    Wait for a process to exit, sleeping on a pidfd where available.
+
+    Popen.wait() with a timeout polls the process with growing sleeps, while a
+    pidfd becomes readable as soon as the process exits (Linux 5.3+).
+
+    Args:
+        process: subprocess.Popen instance to wait for
+        timeout: Maximum time to wait, in seconds
+
+    Returns:
+        int: Exit code of the process
+
+    Raises:
+        subprocess.TimeoutExpired: If the process is still running after timeout
+    """
+    try:
+        fd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        # No pidfd support, or the process was already reaped
+        return process.wait(timeout=timeout)
+
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        poller.poll(timeout * 1000)
+    finally:
+        os.close(fd)
+    return process.wait(timeout=0)
+
+
 def assert_api_success(response, msg="API call failed"):
     """
     Assert that API call succeeded with 2xx status code.
@@ -195,17 +223,33 @@ def gst_pipeline():
         ["gst-launch-1.0", "fakesrc", "is-live=true", "do-timestamp=true", "!", "fakesink", "sync=true"],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
+        # Unbuffered, so select() sees every line readline() has not consumed yet
+        bufsize=0,
     )
 
-    # Give the pipeline time to start and enter PLAYING state
-    time.sleep(3)
+    # Wait for gst-launch to report that it is setting the pipeline to PLAYING
+    timeout = 10  # Maximum time to wait for the pipeline to start
+    start_time = time.time()
 
-    # Verify it's running
-    if process.poll() is not None:
-        stdout, stderr = process.communicate()
-        raise RuntimeError(
-            f"GStreamer pipeline failed to start.\n" f"stdout: {stdout.decode()}\n" f"stderr: {stderr.decode()}"
-        )
+    while (remaining := timeout - (time.time() - start_time)) > 0:
+        # Never block in readline() past the deadline
+        ready, _, _ = select.select([process.stdout], [], [], remaining)
+        if not ready:
+            continue
+        line = process.stdout.readline()
+        if b"Setting pipeline to PLAYING" in line:
+            break
+        if not line:
+            # stdout was closed, the pipeline exited or will never report PLAYING
+            process.kill()
+            stdout, stderr = process.communicate()
+            raise RuntimeError(
+                f"GStreamer pipeline failed to start.\n" f"stdout: {stdout.decode()}\n" f"stderr: {stderr.decode()}"
+            )
+    else:
+        process.kill()
+        process.wait()
+        raise RuntimeError(f"GStreamer pipeline did not reach PLAYING within {timeout} seconds")
 
     print(f"\n✓ GStreamer pipeline started (PID: {process.pid})")
 
@@ -215,7 +259,7 @@ def gst_pipeline():
     print(f"\n✓ Terminating GStreamer pipeline (PID: {process.pid})")
     try:
         process.send_signal(signal.SIGTERM)
-        process.wait(timeout=5)
+        _wait_process(process, timeout=5)
     except subprocess.TimeoutExpired:
         print("⚠ Pipeline didn't terminate gracefully, killing it")
         process.kill()
@@ -306,7 +350,7 @@ def _start_girest_server(gst_pipeline, port=9000):
     if not ready:
         process.send_signal(signal.SIGTERM)
         try:
-            process.wait(timeout=5)
+            _wait_process(process, timeout=5)
         except subprocess.TimeoutExpired:
             process.kill()
             process.wait()
@@ -334,7 +378,7 @@ def _start_girest_server(gst_pipeline, port=9000):
     print("\n✓ Terminating GIRest server...")
     try:
         process.send_signal(signal.SIGTERM)
-        process.wait(timeout=5)
+        _wait_process(process, timeout=5)
     except subprocess.TimeoutExpired:
         print("⚠ Server didn't terminate gracefully, killing it")
         process.kill()
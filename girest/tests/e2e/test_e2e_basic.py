@@ -13,6 +13,8 @@ Note: The gst_pipeline and girest_server fixtures are defined in conftest.py
 and are session-scoped, meaning they're shared across all E2E tests.
 """
 
+import asyncio
+
 import httpx
 import pytest
 
@@ -504,3 +506,28 @@ async def test_struct_field_array(girest_server):
         print("✓ Unreffed buffer")
 
         print("✓ Struct field array test completed successfully!")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests(girest_server):
+    """
+    Test that independent requests issued concurrently all succeed.
+
+    The server runs the Frida calls on a thread pool, so read-only endpoints
+    requested together with asyncio.gather must each get their own response.
+    """
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        string_response, version_response, gtype_response = await asyncio.gather(
+            client.get(f"{girest_server}/Gst/version_string"),
+            client.get(f"{girest_server}/Gst/version"),
+            client.get(f"{girest_server}/Gst/Bin/get_type"),
+        )
+
+    data = assert_api_success(string_response, "Failed to get version string")
+    assert isinstance(data["return"], str), "Return value should be a string"
+
+    data = assert_api_success(version_response, "Failed to get version")
+    assert {"major", "minor", "micro", "nano"} <= data.keys(), f"Unexpected version response: {data}"
+
+    data = assert_api_success(gtype_response, "Failed to get GstBin GType")
+    assert data["return"], "GType should not be null"
@@ -12,74 +12,105 @@ generates TypeScript client bindings from OpenAPI schemas, including:
 
 import re
 
-from .conftest import find_class_in_files
+_VERSION_STRING_RE = re.compile(
+    r"export async function version_string\([^)]*\): Promise<string> \{(.*?)^\}", re.DOTALL | re.MULTILINE
+)
 
+# Lines that end a method of a generated class: the next method or the end of the class
+_METHOD_TERMINATORS = ("\n  async ", "\n  static ", "\n}")
 
-def test_gst_pipeline_inheritance(gst_typescript):
+
+def extract_class(content: str, header: str) -> str:
+    """
+    Extract a class from a generated TypeScript file.
+
+    Args:
+        content: TypeScript code of the file
+        header: Start of the class declaration (e.g. "export class GstObject extends")
+
+    Returns:
+        The file content from the class declaration on, or empty string if not found
+    """
+    start = content.find(header)
+    return content[start:] if start != -1 else ""
+
+
+def extract_method(class_content: str, signature: str) -> str:
+    """
+    Extract the source of a method from a generated class.
+
+    Args:
+        class_content: TypeScript code containing the class
+        signature: Start of the method signature (e.g. "async copy(")
+
+    Returns:
+        The method source up to the next method or the end of the class, or empty string if not found
+    """
+    start = class_content.find(signature)
+    if start == -1:
+        return ""
+    ends = [class_content.find(terminator, start + 1) for terminator in _METHOD_TERMINATORS]
+    return class_content[start : min((end for end in ends if end != -1), default=len(class_content))]
+
+
+def test_gst_pipeline_inheritance(gst_classes):
     """Test that GstPipeline extends GstBin."""
-    files_dict = gst_typescript
-    output = find_class_in_files(files_dict, "GstPipeline")
+    output = gst_classes.get("GstPipeline", "")
     assert output, "GstPipeline class not found"
     assert "export class GstPipeline extends GstBin" in output, "GstPipeline should extend GstBin"
 
 
-def test_gst_bin_inheritance(gst_typescript):
+def test_gst_bin_inheritance(gst_classes):
     """Test that GstBin extends GstElement."""
-    files_dict = gst_typescript
-    output = find_class_in_files(files_dict, "GstBin")
+    output = gst_classes.get("GstBin", "")
     assert output, "GstBin class not found"
     assert "export class GstBin extends GstElement" in output, "GstBin should extend GstElement"
 
 
-def test_gst_element_inheritance(gst_typescript):
+def test_gst_element_inheritance(gst_classes):
     """Test that GstElement extends GstObject."""
-    files_dict = gst_typescript
-    output = find_class_in_files(files_dict, "GstElement")
+    output = gst_classes.get("GstElement", "")
     assert output, "GstElement class not found"
     assert "export class GstElement extends GstObject" in output, "GstElement should extend GstObject"
 
 
-def test_gst_object_inheritance(gst_typescript):
+def test_gst_object_inheritance(gst_classes):
     """Test that GstObject extends GObjectInitiallyUnowned."""
-    files_dict = gst_typescript
-    output = find_class_in_files(files_dict, "GstObject")
+    output = gst_classes.get("GstObject", "")
     assert output, "GstObject class not found"
     assert (
         "export class GstObject extends GObjectInitiallyUnowned" in output
     ), "GstObject should extend GObjectInitiallyUnowned"
 
 
-def test_gobject_initially_unowned_inheritance(gst_typescript):
+def test_gobject_initially_unowned_inheritance(gst_classes):
     """Test that GObjectInitiallyUnowned extends GObjectObject."""
-    files_dict = gst_typescript
-    output = find_class_in_files(files_dict, "GObjectInitiallyUnowned")
+    output = gst_classes.get("GObjectInitiallyUnowned", "")
     assert output, "GObjectInitiallyUnowned class not found"
     assert (
         "export class GObjectInitiallyUnowned extends GObjectObject" in output
     ), "GObjectInitiallyUnowned should extend GObjectObject"
 
 
-def test_gobject_object_inheritance(gst_typescript):
+def test_gobject_object_inheritance(gst_classes):
     """Test that GObjectObject extends GObjectTypeInstance."""
-    files_dict = gst_typescript
-    output = find_class_in_files(files_dict, "GObjectObject")
+    output = gst_classes.get("GObjectObject", "")
     assert output, "GObjectObject class not found"
     assert (
         "export class GObjectObject extends GObjectTypeInstance" in output
     ), "GObjectObject should extend GObjectTypeInstance"
 
 
-def test_gobject_type_instance_is_base_class(gst_typescript):
+def test_gobject_type_instance_is_base_class(gst_classes):
     """Test that GObjectTypeInstance is a base class with no parent."""
-    files_dict = gst_typescript
-    output = find_class_in_files(files_dict, "GObjectTypeInstance")
+    output = gst_classes.get("GObjectTypeInstance", "")
     assert output, "GObjectTypeInstance class not found"
     # Should have "export class GObjectTypeInstance {" without "extends"
     assert "export class GObjectTypeInstance {" in output, "GObjectTypeInstance should be a base class"
     assert "export class GObjectTypeInstance extends" not in output, "GObjectTypeInstance should not extend anything"
 
 
-def test_gobject_base_class_structure(gst_typescript):
+def test_gobject_base_class_structure(gst_classes):
     """
     Test that GObjectObject has the correct structure.
 
@@ -89,15 +120,12 @@ def test_gobject_base_class_structure(gst_typescript):
     - castTo method
     - Does NOT have unref method (destructors are excluded from API)
     """
-    files_dict = gst_typescript
-    output = find_class_in_files(files_dict, "GObjectObject")
+    output = gst_classes.get("GObjectObject", "")
     assert output, "GObjectObject class not found in any generated file"
 
     # Find the GObjectObject class definition
-    match = re.search(r"export class GObjectObject extends GObjectTypeInstance \{(.*?)$", output, re.DOTALL)
-    assert match, "GObjectObject class extending GObjectTypeInstance not found in generated TypeScript"
-
-    gobject_class = match.group(0)
+    gobject_class = extract_class(output, "export class GObjectObject extends GObjectTypeInstance {")
+    assert gobject_class, "GObjectObject class extending GObjectTypeInstance not found in generated TypeScript"
 
     # Verify it has the required structure
     assert (
@@ -113,15 +141,14 @@ def test_gobject_base_class_structure(gst_typescript):
     ), "GObjectObject should NOT have unref method (destructors are excluded from API)"
 
 
-def test_intermediate_classes_generated(gst_typescript):
+def test_intermediate_classes_generated(gst_classes):
     """
     Test that intermediate classes without instance methods are still generated.
 
     Verifies that GObjectInitiallyUnowned is generated as a class in the
     inheritance chain with only a static get_type method.
     """
-    files_dict = gst_typescript
-    output = find_class_in_files(files_dict, "GObjectInitiallyUnowned")
+    output = gst_classes.get("GObjectInitiallyUnowned", "")
 
     # GObjectInitiallyUnowned should be generated as a class
     assert (
@@ -129,10 +156,11 @@ def test_intermediate_classes_generated(gst_typescript):
     ), "GObjectInitiallyUnowned should be generated as a class extending GObjectObject"
 
     # It should be a class with only static methods (like get_type)
-    match = re.search(r"export class GObjectInitiallyUnowned extends GObjectObject \{(.*?)$", output, re.DOTALL)
-    assert match, "GObjectInitiallyUnowned class structure not found"
+    header = "export class GObjectInitiallyUnowned extends GObjectObject {"
+    class_section = extract_class(output, header)
+    assert class_section, "GObjectInitiallyUnowned class structure not found"
 
-    class_body = match.group(1).strip()
+    class_body = class_section[len(header) :].strip()
     # Class body should contain only static methods, no instance methods
     assert "static async get_type():" in class_body, "GObjectInitiallyUnowned should have static get_type method"
     # Should not have instance methods (no 'async ' without 'static async')
@@ -143,7 +171,7 @@ def test_intermediate_classes_generated(gst_typescript):
     ), f"GObjectInitiallyUnowned should not have instance methods, but found: {instance_methods}"
 
 
-def test_element_factory_inheritance(gst_typescript):
+def test_element_factory_inheritance(gst_classes):
     """
     Test another inheritance chain: GstElementFactory.
 
@@ -151,8 +179,7 @@ def test_element_factory_inheritance(gst_typescript):
     which extends GstObject, demonstrating that the fix works
     for multiple inheritance chains.
     """
-    files_dict = gst_typescript
-    factory_content = find_class_in_files(files_dict, "GstElementFactory")
+    factory_content = gst_classes.get("GstElementFactory", "")
     assert factory_content, "GstElementFactory class not found"
 
     # Verify GstElementFactory inheritance
@@ -161,10 +188,9 @@ def test_element_factory_inheritance(gst_typescript):
     ), "GstElementFactory should extend GstPluginFeature"
 
 
-def test_plugin_feature_inheritance(gst_typescript):
+def test_plugin_feature_inheritance(gst_classes):
     """Test that GstPluginFeature extends GstObject."""
-    files_dict = gst_typescript
-    feature_content = find_class_in_files(files_dict, "GstPluginFeature")
+    feature_content = gst_classes.get("GstPluginFeature", "")
     assert feature_content, "GstPluginFeature class not found"
 
     # Verify GstPluginFeature inheritance
@@ -173,12 +199,11 @@ def test_plugin_feature_inheritance(gst_typescript):
     ), "GstPluginFeature should extend GstObject"
 
 
-def test_typescript_generation_with_generic_constructors(gst_typescript):
+def test_typescript_generation_with_generic_constructors(gst_classes):
     """
     Test that TypeScript generator properly handles generic constructors.
     """
-    files_dict = gst_typescript
-    typescript = find_class_in_files(files_dict, "GstMeta")
+    typescript = gst_classes.get("GstMeta", "")
 
     # GstMeta should have a static new method in the TypeScript class
     assert "export class GstMeta {" in typescript, "GstMeta should be generated as a class"
@@ -191,17 +216,14 @@ def test_typescript_generation_with_generic_constructors(gst_typescript):
     # The class should have instance methods
     assert "async " in typescript, "GstMeta should have async methods"
 
-    print("✓ TypeScript generator creates classes with generic constructors")
-
 
-def test_typescript_class_generation_for_structs(gst_typescript):
+def test_typescript_class_generation_for_structs(gst_classes):
     """
     Test that TypeScript generator creates classes for structs with methods.
 
     Uses GstBuffer as a test case.
     """
-    files_dict = gst_typescript
-    typescript = find_class_in_files(files_dict, "GstBuffer")
+    typescript = gst_classes.get("GstBuffer", "")
 
     # Verify GstBuffer is generated as a class, not an interface
     # It extends GstMiniObject
@@ -210,9 +232,7 @@ def test_typescript_class_generation_for_structs(gst_typescript):
     ), "GstBuffer should be generated as a class extending GstMiniObject"
 
     # Verify it's not also generated as an interface (avoid duplication)
-    # Count occurrences - should only be the class definition
-    interface_count = typescript.count("export interface GstBuffer {")
-    assert interface_count == 0, f"GstBuffer should not be generated as interface, found {interface_count} occurrences"
+    assert "export interface GstBuffer {" not in typescript, "GstBuffer should not be generated as interface"
 
     # Verify the class has methods
     # Check for at least one constructor
@@ -223,25 +243,20 @@ def test_typescript_class_generation_for_structs(gst_typescript):
     # Check for at least one instance method
     assert "async add_meta(" in typescript, "GstBuffer class should have instance methods"
 
-    print("✓ TypeScript generator creates class for struct with methods")
 
-
-def test_typescript_class_generation_for_structs_without_methods(gst_typescript):
+def test_typescript_class_generation_for_structs_without_methods(gst_classes):
     """
     Test that TypeScript generator creates classes for structs without methods.
 
     Uses GstAllocatorPrivate as a test case.
     """
-    files_dict = gst_typescript
-    typescript = find_class_in_files(files_dict, "GstAllocatorPrivate")
+    typescript = gst_classes.get("GstAllocatorPrivate", "")
 
     # Verify GstAllocatorPrivate is generated as a class
     assert "export class GstAllocatorPrivate {" in typescript, "GstAllocatorPrivate should be generated as a class"
 
-    print("✓ TypeScript generator creates class for struct without methods")
-
 
-def test_typescript_parameter_serialization(gst_typescript):
+def test_typescript_parameter_serialization(gst_classes):
     """
     Test that TypeScript generator properly serializes parameters inline.
 
@@ -251,8 +266,7 @@ def test_typescript_parameter_serialization(gst_typescript):
     - Query parameters with objects use the format `'ptr,' + param.ptr` (explode=false)
     - Primitive parameters use String() conversion
     """
-    files_dict = gst_typescript
-    typescript = find_class_in_files(files_dict, "GLibDate")
+    typescript = gst_classes.get("GLibDate", "")
 
     # Verify no serializeParam function exists (serialization is done inline)
     assert (
@@ -260,13 +274,8 @@ def test_typescript_parameter_serialization(gst_typescript):
     ), "serializeParam function should NOT be generated - serialization should be inline"
 
     # Find a method with object parameter (days_between has GLibDate object parameter)
-    import re
-
-    match = re.search(r"async days_between\(date2: GLibDate\)", typescript)
-    if match:
-        start_pos = match.start()
-        method_section = typescript[start_pos : start_pos + 500]
-
+    method_section = extract_method(typescript, "async days_between(date2: GLibDate)")
+    if method_section:
         # Check that path parameter is serialized inline for objects (explode=false)
         assert (
             "ptr,${this.ptr}" in method_section
@@ -278,11 +287,8 @@ def test_typescript_parameter_serialization(gst_typescript):
         ), "Query parameter 'date2' should be serialized inline as 'ptr,' + date2.ptr"
 
     # Find a method with primitive parameter (set_day has number parameter)
-    match = re.search(r"async set_day\(day: number\)", typescript)
-    if match:
-        start_pos = match.start()
-        method_section = typescript[start_pos : start_pos + 500]
-
+    method_section = extract_method(typescript, "async set_day(day: number)")
+    if method_section:
         # Primitive parameters should use String() conversion
         assert "String(day)" in method_section, "Primitive parameter 'day' should use String() conversion"
 
@@ -291,10 +297,8 @@ def test_typescript_parameter_serialization(gst_typescript):
             "ptr,${this.ptr}" in method_section
         ), "Path parameter 'self' should be serialized inline even for methods with primitive query params"
 
-    print("✓ TypeScript generator serializes parameters inline with correct style/explode")
-
 
-def test_typescript_object_return_value_instantiation(gst_typescript):
+def test_typescript_object_return_value_instantiation(gst_classes):
     """
     Test that TypeScript generator properly instantiates object return values.
 
@@ -303,24 +307,14 @@ def test_typescript_object_return_value_instantiation(gst_typescript):
     - The instantiation code checks if data.return is an object with a ptr field
     - Primitive return values are returned directly without instantiation
     """
-    files_dict = gst_typescript
-    typescript = find_class_in_files(files_dict, "GstAllocationParams")
+    typescript = gst_classes.get("GstAllocationParams", "")
 
     # Find a method that returns an object (copy method of GstAllocationParams)
-    import re
-
     # Look for the copy method in GstAllocationParams class
-    gst_allocation_match = re.search(r"export class GstAllocationParams.*?$", typescript, re.DOTALL)
-    if gst_allocation_match:
-        allocation_class = gst_allocation_match.group(0)
-        copy_match = re.search(
-            r"async copy\(\): Promise<GstAllocationParams>.*?(?=\n  async |\n  static |\n})",
-            allocation_class,
-            re.DOTALL,
-        )
-        if copy_match:
-            method_section = copy_match.group(0)
-
+    allocation_class = extract_class(typescript, "export class GstAllocationParams")
+    if allocation_class:
+        method_section = extract_method(allocation_class, "async copy(): Promise<GstAllocationParams>")
+        if method_section:
             # Check that it instantiates the object from ptr
             assert (
                 "new GstAllocationParams(data.return.ptr)" in method_section
@@ -331,8 +325,6 @@ def test_typescript_object_return_value_instantiation(gst_typescript):
                 "typeof data.return === 'object' && 'ptr' in data.return" in method_section
             ), "Method returning object should check if data.return is an object with ptr field"
 
-    print("✓ TypeScript generator instantiates object return values correctly")
-
 
 def test_typescript_primitive_return_values(gst_typescript):
     """
@@ -352,9 +344,7 @@ def test_typescript_primitive_return_values(gst_typescript):
     content = files_dict[gst_file]
 
     # Find the version_string method
-    match = re.search(
-        r"export async function version_string\([^)]*\): Promise<string> \{(.*?)^\}", content, re.DOTALL | re.MULTILINE
-    )
+    match = _VERSION_STRING_RE.search(content)
     assert match, "version_string() method not found in Gst.ts"
     method_section = match.group(0)
 
@@ -371,10 +361,8 @@ def test_typescript_primitive_return_values(gst_typescript):
         "data.return.ptr" not in method_section
     ), "version_string() should not access data.return.ptr for primitive return value"
 
-    print("\u2713 TypeScript generator handles primitive return values correctly for Gst.version_string()")
 
-
-def test_typescript_duplicate_method_names_in_inheritance_chain(gst_typescript):
+def test_typescript_duplicate_method_names_in_inheritance_chain(gst_classes):
     """
     Test that TypeScript generator handles duplicate method names in inheritance chain.
 
@@ -385,36 +373,32 @@ def test_typescript_duplicate_method_names_in_inheritance_chain(gst_typescript):
     - GstObject has get_g_value_array method
     - GstControlBinding (which extends GstObject) has get_g_value_array_2 method
     """
-    files_dict = gst_typescript
-    import re
 
     # Find GstObject class and verify it has get_g_value_array method
-    gst_object_content = find_class_in_files(files_dict, "GstObject")
+    gst_object_content = gst_classes.get("GstObject", "")
     assert gst_object_content, "GstObject class not found in generated TypeScript"
 
-    gst_object_match = re.search(r"export class GstObject extends.*?$", gst_object_content, re.DOTALL)
-    assert gst_object_match, "GstObject class pattern not found"
-    gst_object_class = gst_object_match.group(0)
+    gst_object_class = extract_class(gst_object_content, "export class GstObject extends")
+    assert gst_object_class, "GstObject class pattern not found"
 
     # Verify GstObject has get_g_value_array method (without suffix)
-    assert re.search(r"async get_g_value_array\(", gst_object_class), "GstObject should have get_g_value_array method"
+    assert "async get_g_value_array(" in gst_object_class, "GstObject should have get_g_value_array method"
 
     # Verify GstObject doesn't have get_g_value_array_2 (it's the parent)
-    assert not re.search(
-        r"async get_g_value_array_2\(", gst_object_class
+    assert (
+        "async get_g_value_array_2(" not in gst_object_class
     ), "GstObject should not have get_g_value_array_2 method (it's the parent)"
 
     # Find GstControlBinding class and verify it has get_g_value_array_2 method
-    control_binding_content = find_class_in_files(files_dict, "GstControlBinding")
+    control_binding_content = gst_classes.get("GstControlBinding", "")
     assert control_binding_content, "GstControlBinding class not found in generated TypeScript"
 
-    control_binding_match = re.search(r"export class GstControlBinding extends.*?$", control_binding_content, re.DOTALL)
-    assert control_binding_match, "GstControlBinding class pattern not found"
-    control_binding_class = control_binding_match.group(0)
+    control_binding_class = extract_class(control_binding_content, "export class GstControlBinding extends")
+    assert control_binding_class, "GstControlBinding class pattern not found"
 
     # Verify GstControlBinding has get_g_value_array_2 method (with suffix)
-    assert re.search(
-        r"async get_g_value_array_2\(", control_binding_class
+    assert (
+        "async get_g_value_array_2(" in control_binding_class
     ), "GstControlBinding should have get_g_value_array_2 method (renamed to avoid conflict with parent)"
 
     # Verify GstControlBinding doesn't have get_g_value_array (without suffix)
@@ -423,10 +407,8 @@ def test_typescript_duplicate_method_names_in_inheritance_chain(gst_typescript):
         "async get_g_value_array(" not in control_binding_class or "async get_g_value_array_" in control_binding_class
     ), "GstControlBinding should not have get_g_value_array method (conflicts with parent)"
 
-    print("✓ TypeScript generator handles duplicate method names in inheritance chain correctly")
-
 
-def test_typescript_destructors_included_in_api(gst_typescript):
+def test_typescript_destructors_included_in_api(gst_classes):
     """
     Test that methods marked as x-gi-destructor are included in the TypeScript API.
 
@@ -436,27 +418,23 @@ def test_typescript_destructors_included_in_api(gst_typescript):
     - The FinalizationRegistry system is still generated for automatic cleanup
     - Struct registries are properly generated for cleanup
     """
-    files_dict = gst_typescript
-    import re
 
     # Test 1: GObjectTypeInterface should have a callable 'free' method
-    type_interface_content = find_class_in_files(files_dict, "GObjectTypeInterface")
+    type_interface_content = gst_classes.get("GObjectTypeInterface", "")
     assert type_interface_content, "GObjectTypeInterface class not found in generated TypeScript"
 
-    type_interface_match = re.search(r"export class GObjectTypeInterface.*?$", type_interface_content, re.DOTALL)
-    assert type_interface_match, "GObjectTypeInterface class pattern not found"
-    class_content = type_interface_match.group(0)
+    class_content = extract_class(type_interface_content, "export class GObjectTypeInterface")
+    assert class_content, "GObjectTypeInterface class pattern not found"
 
     # Should have a callable free method for manual cleanup
     assert "async free(" in class_content, "GObjectTypeInterface should have a callable free method for manual cleanup"
 
     # Test 2: GObjectObject should have a callable 'unref' method
-    gobject_content = find_class_in_files(files_dict, "GObjectObject")
+    gobject_content = gst_classes.get("GObjectObject", "")
     assert gobject_content, "GObjectObject class not found in generated TypeScript"
 
-    gobject_match = re.search(r"export class GObjectObject.*?$", gobject_content, re.DOTALL)
-    assert gobject_match, "GObjectObject class pattern not found"
-    gobject_class_content = gobject_match.group(0)
+    gobject_class_content = extract_class(gobject_content, "export class GObjectObject")
+    assert gobject_class_content, "GObjectObject class pattern not found"
 
     # Should have a callable unref method for manual cleanup
     assert (
@@ -471,8 +449,6 @@ def test_typescript_destructors_included_in_api(gst_typescript):
         "gobjecttypeinterfaceRegistry.register(instance, ptr)" in class_content
     ), "Static create() method should register objects with FinalizationRegistry based on transferType"
 
-    print("✓ TypeScript generator includes destructors in API for proper memory management")
-
 
 def test_finalization_registry_present(gst_typescript):
     """Test that FinalizationRegistry is present for automatic memory management."""
@@ -493,8 +469,6 @@ def test_finalization_registry_present(gst_typescript):
     assert found_finalization, "FinalizationRegistry should be present for automatic memory management"
     assert found_registry, "gobjecttypeinterfaceRegistry should be present for GObjectTypeInterface cleanup"
 
-    print("✓ Finalization registry system is properly generated")
-
 
 def test_param_class():
     """Test the new Param class functionality with Type class."""
@@ -561,5 +535,3 @@ def test_param_class():
     ref_type_obj = Type({"$ref": "#/components/schemas/TestType"}, generator)
     assert ref_type_obj.ref_schema.name == "TestType"
     assert ref_type_obj.lang_type == "TestType"
-
-    print("✓ Param class correctly parses parameter definitions and handles types with new Type class")
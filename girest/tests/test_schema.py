@@ -81,9 +81,7 @@ def test_no_generic_endpoints_for_structs_with_constructors(gst_schema):
 
     # GstBuffer has actual constructors, so it should NOT have generic ones
     # Check that the new endpoint exists but is NOT generic
-    buffer_new_paths = [p for p in schema["paths"] if "/Buffer/new" in p]
-
-    assert len(buffer_new_paths) > 0, "GstBuffer should have constructor endpoints"
+    assert any("/Buffer/new" in p for p in schema["paths"]), "GstBuffer should have constructor endpoints"
 
     print("✓ GstBuffer has real constructors")
 
@@ -118,14 +116,13 @@ def test_multiple_structs_with_generic_endpoints(gst_schema):
 
     # Find all new endpoints marked as constructors (which includes generic ones)
     # Generic constructors can be identified by checking if they're in structs
-    constructor_endpoints = []
-    for path, operations in schema["paths"].items():
-        for method, operation in operations.items():
-            if operation.get("x-gi-constructor"):
-                op_id = operation["operationId"]
-                # Generic constructors follow pattern: namespace-structname-new
-                if op_id.endswith("-new"):
-                    constructor_endpoints.append(op_id)
+    # Generic constructors follow pattern: namespace-structname-new
+    constructor_endpoints = [
+        operation["operationId"]
+        for operations in schema["paths"].values()
+        for operation in operations.values()
+        if operation.get("x-gi-constructor") and operation["operationId"].endswith("-new")
+    ]
 
     # Should have multiple constructors
     assert len(constructor_endpoints) >= 5, f"Expected at least 5 constructors, found {len(constructor_endpoints)}"
@@ -8,17 +8,13 @@ with real GIRest endpoints that have object parameters in the URL.
 
 import pytest
 
-from girest.main import GIRest
 from girest.uri_parser import URITemplateParser
 from girest.validators import GIRestParameterValidator
 
 
-def test_object_in_path_parameter():
+def test_object_in_path_parameter(gst_schema):
     """Test that path parameters with object schemas are handled correctly."""
-    # Generate a real schema
-    girest = GIRest("Gst", "1.0")
-    spec = girest.generate()
-    spec_dict = spec.to_dict()
+    spec_dict = gst_schema
 
     # Find an endpoint with an object in the path
     path = "/Gst/AllocationParams/{self}/copy"
@@ -41,12 +37,9 @@ def test_object_in_path_parameter():
     assert resolved["self"] == {"ptr": "0x12345"}, f"Expected {{'ptr': '0x12345'}}, got {resolved['self']}"
 
 
-def test_allof_schema_in_path():
+def test_allof_schema_in_path(gst_schema):
     """Test that path parameters with allOf schemas are handled correctly."""
-    # Generate a real schema
-    girest = GIRest("Gst", "1.0")
-    spec = girest.generate()
-    spec_dict = spec.to_dict()
+    spec_dict = gst_schema
 
     # Find an endpoint with an object that has allOf (inheritance)
     # Look for a GObject method since GObject has inheritance
@@ -172,12 +165,9 @@ def test_form_style_explode_query_params():
     assert isinstance(resolved["filter"], dict)
 
 
-def test_integration_with_real_endpoint():
+def test_integration_with_real_endpoint(gst_schema):
     """Integration test using a real GIRest endpoint schema."""
-    # Generate the schema
-    girest = GIRest("Gst", "1.0")
-    spec = girest.generate()
-    spec_dict = spec.to_dict()
+    spec_dict = gst_schema
 
     # Get a method endpoint
     path = "/Gst/AllocationParams/{self}/copy"